@@ -13,34 +13,98 @@ ULTRA-DETAILED analysis of a JSON report produced by checkdmarc
 Usage:
     python3 checkdmarc_enhanced.py scan.json [scan2.json ...]
 
+    For large batches, PyPy is the recommended interpreter: the analysis is
+    pure branchy string/dict work that its JIT handles well, and every
+    C-extension dependency (orjson, numpy, openpyxl) is optional
+    with a pure-Python fallback, so the module imports cleanly there:
+
+    pypy3 checkdmarc_enhanced.py scans/*.json
+
 Output:
     - Exhaustive diagnostics with detailed explanations
     - Return code 0 if no CRITICAL, 1 otherwise (useful in CI/CD)
 
 Author: ChatGPT & AI Assistant (2025)
 """
+import bisect
+import contextlib
+import functools
+import hashlib
+import io
 import json
+import os
+import re
 import sys
+import types
+import zipfile
+from collections import Counter
+from xml.sax.saxutils import escape
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import Any, Final, Iterator, List, Dict, Mapping, NamedTuple, Tuple, Optional
 import argparse
 try:
-    import pandas as pd
-    import openpyxl
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    from openpyxl.chart import BarChart, PieChart, Reference
-    EXCEL_AVAILABLE = True
-    print("📊 Excel libraries loaded successfully")
-except ImportError as e:
-    EXCEL_AVAILABLE = False
-    print(f"⚠️ Excel import error: {e}")
-except Exception as e:
-    EXCEL_AVAILABLE = False
-    print(f"⚠️ Excel error: {e}")
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+try:
+    import jiter  # type: ignore[import-not-found]
+
+    def _loads(data: bytes) -> dict:
+        # cache_mode="all" dedupes the repeated keys ("record", "valid", "tags", ...)
+        # that occur thousands of times across checkdmarc sub-records
+        return jiter.from_json(data, cache_mode="all")
+except ImportError:
+    # orjson parses the nested checkdmarc dicts roughly 2x faster than the
+    # stdlib and takes bytes directly, skipping the read_text decode pass.
+    _loads = orjson.loads if orjson is not None else json.loads  # type: ignore[assignment]
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+# openpyxl is only needed for --excel and costs a few hundred ms (and
+# tens of MB RSS) to import, so it is probed lazily on first use instead
+# of slowing down every stdout-only invocation. The names it binds get
+# Any placeholders here so the module stays checkable (mypy/mypyc)
+# without openpyxl installed.
+OPENPYXL_AVAILABLE: Optional[bool] = None
+openpyxl: Any = None
+Font: Any = None
+PatternFill: Any = None
+Alignment: Any = None
+Border: Any = None
+Side: Any = None
+BarChart: Any = None
+PieChart: Any = None
+Reference: Any = None
+WriteOnlyCell: Any = None
+
+def _load_openpyxl() -> bool:
+    global OPENPYXL_AVAILABLE
+    global openpyxl, Font, PatternFill, Alignment, Border, Side
+    global BarChart, PieChart, Reference, WriteOnlyCell
+    if OPENPYXL_AVAILABLE is None:
+        try:
+            import openpyxl  # type: ignore[import-untyped, no-redef]
+            from openpyxl.styles import Font, PatternFill, Alignment, Border, Side  # type: ignore[import-untyped, no-redef]
+            from openpyxl.chart import BarChart, PieChart, Reference  # type: ignore[import-untyped, no-redef]
+            from openpyxl.cell import WriteOnlyCell  # type: ignore[import-untyped, no-redef]
+            OPENPYXL_AVAILABLE = True
+            print("📊 Excel libraries loaded successfully")
+        except ImportError as e:
+            OPENPYXL_AVAILABLE = False
+            print(f"⚠️ Excel import error: {e}")
+        except Exception as e:
+            OPENPYXL_AVAILABLE = False
+            print(f"⚠️ Excel error: {e}")
+    return OPENPYXL_AVAILABLE
 
 # ----------------- Improved Official References -----------------
 
-REF: Dict[str, str] = {
+# Read-only after init: frozen behind a MappingProxyType (like _EMPTY
+# below) with interned keys, so lookups against the compiler-interned
+# ref literals hit CPython's identity fast path.
+REF: Final[Mapping[str, str]] = types.MappingProxyType({sys.intern(k): v for k, v in {
     "SPF_LIMIT": "RFC 7208 §4.6.4 – 10 DNS lookup limit | https://tools.ietf.org/html/rfc7208#section-4.6.4",
     "SPF_ALL": "NIST SP 800-177r1 §2.3 – Use of '-all' | https://csrc.nist.gov/publications/detail/sp/800-177/rev-1/final",
     "DKIM_LEN": "RFC 8301 – Minimum 1024 bits, recommended 2048 | https://tools.ietf.org/html/rfc8301",
@@ -48,935 +112,1144 @@ REF: Dict[str, str] = {
     "MTA_STS": "RFC 8461 – MTA-STS enforce vs testing | https://tools.ietf.org/html/rfc8461",
     "TLS_RPT": "RFC 8460 – SMTP TLS Reporting | https://tools.ietf.org/html/rfc8460",
     "DNSSEC": "RFC 4033-35 – DNS Authentication | https://tools.ietf.org/html/rfc4033",
+    "MX": "RFC 5321 §5 & RFC 3207 – MX resolution / SMTP STARTTLS | https://tools.ietf.org/html/rfc3207",
     "BIMI": "BIMI WG draft – DMARC p=quarantine/reject required | https://datatracker.ietf.org/doc/draft-brand-indicators-for-message-identification/"
-}
+}.items()})
 
 # ----------------- Improved Helpers -----------------
 
-Status = Tuple[str, str, str]  # (LEVEL, MESSAGE, REFKEY)
+class Status(NamedTuple):
+    """A single finding. Tuple-based (indexing/unpacking keep working) with
+    no per-instance __dict__, so batches of findings stay compact."""
+    level: str
+    msg: str
+    ref: str
+
+
+_ICONS = {"OK": "✅", "WARNING": "⚠️", "CRITICAL": "🚨", "INFO": "ℹ️"}
+
+# Only emit ANSI escapes on a real terminal: redirected/CI output stays
+# plain text and a few bytes smaller per line.
+_TTY = sys.stdout.isatty()
+if _TTY:
+    _COLORS = {"OK": "\033[92m", "WARNING": "\033[93m", "CRITICAL": "\033[91m", "INFO": "\033[94m"}
+    _RESET = "\033[0m"
+else:
+    _COLORS = {lvl: "" for lvl in _ICONS}
+    _RESET = ""
 
-def status(level: str, msg: str, ref: str) -> Status:
-    return (level, msg, ref)
+# Icon + colored level bracket for each of the four known levels, rendered
+# once at import so the print path does a single dict lookup per status.
+_LEVEL_PREFIX = {lvl: f"{_ICONS[lvl]} [{_COLORS[lvl]}{lvl}{_RESET}] " for lvl in _ICONS}
+
+# Shared read-only default for .get() chains over optional report sections:
+# a literal {} default allocates a fresh dict on every miss. The proxy makes
+# the shared instance actually immutable, so a stray .setdefault() on a
+# fallback can never leak state between domains.
+_EMPTY: Final[Mapping[str, Any]] = types.MappingProxyType({})
+
+# The reference footer for each known REF key, rendered once at import.
+# Status keeps the short ref KEY (the Excel path groups on it); only the
+# print path wants the expanded line, so it is precomputed here rather
+# than re-concatenated per finding.
+_REF_LINES = {key: f"   📚 Reference: {text}\n\n" for key, text in REF.items()}
+
+def format_status(s: Status) -> str:
+    prefix = _LEVEL_PREFIX.get(s.level) or f"❓ [{s.level}] "
+    ref_line = _REF_LINES.get(s.ref) or f"   📚 Reference: {s.ref}\n\n"
+    return f"{prefix}{s.msg}\n{ref_line}"
 
 def print_status(s: Status) -> None:
-    lvl, msg, ref = s
-    icons = {"OK": "✅", "WARNING": "⚠️", "CRITICAL": "🚨", "INFO": "ℹ️"}
-    colors = {"OK": "\033[92m", "WARNING": "\033[93m", "CRITICAL": "\033[91m", "INFO": "\033[94m"}
-    
-    icon = icons.get(lvl, "❓")
-    color = colors.get(lvl, "\033[0m")
-    reset = "\033[0m"
-    
-    print(f"{icon} [{color}{lvl}{reset}] {msg}")
-    print(f"   📚 Reference: {REF.get(ref, ref)}")
-    print()
+    sys.stdout.write(format_status(s))
+
+# ----------------- Declarative rule tables -----------------
+# The 'all'-qualifier and DMARC-policy cascades are data, not control flow:
+# every outcome is a fixed Status, so the tables are built once at import
+# and classification collapses to a single dict lookup per record instead
+# of an if/elif ladder rebuilding the same multi-KB strings on every call.
+
+_SPF_ALL_RE = re.compile(r'([-~+?])all')
+
+def _classify_spf_all(record: str) -> Optional[str]:
+    """Returns the qualifier of the SPF 'all' mechanism, or None if absent.
+
+    One regex pass over the record instead of four substring scans; '-all'
+    only counts when it terminates the record, matching the strict check
+    recommended by NIST SP 800-177r1.
+    """
+    qualifiers = set(_SPF_ALL_RE.findall(record))
+    if "-" in qualifiers and record.strip().endswith("-all"):
+        return "-"
+    for qualifier in ("~", "+", "?"):
+        if qualifier in qualifiers:
+            return qualifier
+    return None
+
+_SPF_ALL_RULES: Dict[Optional[str], Status] = {
+    "-": Status("OK",
+                "MAXIMUM SPF PROTECTION ENABLED! 🛡️\n"
+                "🎯 DIRECTIVE '-all' (FAIL) = Strictest policy\n"
+                "✅ OPERATION:\n"
+                "   • Authorized emails: ACCEPTED normally\n"
+                "   • Unauthorized emails: REJECTED outright\n"
+                "🏆 BUSINESS ADVANTAGES:\n"
+                "   • Anti-spoofing protection: 95%+\n"
+                "   • Enhanced client trust\n"
+                "   • Domain reputation preserved\n"
+                "   • Maximum security compliance\n"
+                "📊 RESULT: Your domain is TRULY protected!",
+                "SPF_ALL"),
+    "~": Status("WARNING",
+                "PARTIAL SPF PROTECTION - MODERATE RISK ⚠️\n"
+                "🎯 DIRECTIVE '~all' (SOFTFAIL) = Permissive policy\n"
+                "⚡ RISKY OPERATION:\n"
+                "   • Authorized emails: ACCEPTED normally\n"
+                "   • Unauthorized emails: ACCEPTED but marked 'suspicious'\n"
+                "🚨 FREQUENT PROBLEMS:\n"
+                "   • Many servers IGNORE the marking\n"
+                "   • Spoofing still possible\n"
+                "   • False sense of security\n"
+                "📈 STRATEGIC RECOMMENDATION:\n"
+                "   1. Test '-all' mode on test domain\n"
+                "   2. Monitor DMARC reports for 2-4 weeks\n"
+                "   3. Switch to '-all' for real protection\n"
+                "🎯 GOAL: 95% protection instead of 60%",
+                "SPF_ALL"),
+    "+": Status("CRITICAL",
+                "SUICIDAL SPF DIRECTIVE DETECTED! 💀\n"
+                "🚨 DIRECTIVE '+all' (PASS) = SECURITY DISASTER\n"
+                "💥 CATASTROPHIC OPERATION:\n"
+                "   • ALL global servers authorized to send on your behalf\n"
+                "   • Spammers, hackers, competitors: free access\n"
+                "   • SPF turned into 'welcome fraudsters' sign\n"
+                "🔥 IMMEDIATE CONSEQUENCES:\n"
+                "   • Massive spoofing guaranteed\n"
+                "   • Reputation destroyed within hours\n"
+                "   • Blacklisting probable\n"
+                "   • Client trust loss\n"
+                "🆘 URGENT ACTION REQUIRED:\n"
+                "   REPLACE '+all' with '-all' IMMEDIATELY!\n"
+                "⏰ MAXIMUM DELAY: 1 hour (before malicious exploitation)",
+                "SPF_ALL"),
+    "?": Status("WARNING",
+                "SPF IN 'NEUTRAL' MODE - INEFFECTIVE! 🤷\n"
+                "🎯 DIRECTIVE '?all' (NEUTRAL) = No opinion\n"
+                "⚪ USELESS OPERATION:\n"
+                "   • SPF says 'I don't know' for unauthorized\n"
+                "   • Servers apply their local policy (unpredictable)\n"
+                "   • Variable behavior depending on recipients\n"
+                "📊 REAL PROTECTION: ~20% (random)\n"
+                "🎭 PROBLEM: False sense of security\n"
+                "🔧 SOLUTION: Choose '-all' or '~all' based on risk tolerance",
+                "SPF_ALL"),
+    None: Status("CRITICAL",
+                 "INCOMPLETE SPF - NO 'ALL' DIRECTIVE! 🕳️\n"
+                 "🚨 MAJOR PROBLEM: Truncated SPF record\n"
+                 "⚡ UNPREDICTABLE BEHAVIOR:\n"
+                 "   • Each server applies ITS default policy\n"
+                 "   • Gmail: may accept or reject\n"
+                 "   • Outlook: different behavior\n"
+                 "   • Private servers: totally random\n"
+                 "🎲 RESULT: Random protection (0-70%)\n"
+                 "🎯 DIAGNOSIS: Configuration error or truncated record\n"
+                 "🛠️ SIMPLE FIX: Add '-all' at end of record\n"
+                 "📝 EXAMPLE: 'v=spf1 ip4:1.2.3.4 include:_spf.google.com -all'",
+                 "SPF_ALL"),
+}
+
+_DMARC_POLICY_RULES: Dict[str, Status] = {
+    "none": Status("CRITICAL",
+                   "DMARC IN 'OBSERVATION' MODE ONLY! 👁️\n"
+                   "⚠️ POLICY p=none = No active protection\n"
+                   "📊 CURRENT OPERATION:\n"
+                   "   • Fraudulent emails: ACCEPTED without restriction\n"
+                   "   • Reports generated: YES (data collected)\n"
+                   "   • Corrective action: NONE\n"
+                   "🎯 LIMITED UTILITY:\n"
+                   "   ✅ Monitoring and flow analysis\n"
+                   "   ✅ Identification of missing legitimate sources\n"
+                   "   ❌ Zero protection against spoofing\n"
+                   "📈 RECOMMENDED PROGRESSION:\n"
+                   "   1. Analyze DMARC reports for 4-6 weeks\n"
+                   "   2. Identify missing legitimate sources\n"
+                   "   3. Fix SPF/DKIM if necessary\n"
+                   "   4. Move to p=quarantine then p=reject\n"
+                   "⏰ GOAL: Active protection within 2-3 months maximum",
+                   "DMARC_POLICY"),
+    "quarantine": Status("WARNING",
+                         "DMARC IN 'QUARANTINE' MODE - PARTIAL PROTECTION ⚠️\n"
+                         "🎯 POLICY p=quarantine = Suspicious emails to spam\n"
+                         "📊 CURRENT OPERATION:\n"
+                         "   • Legitimate emails (SPF/DKIM OK): Inbox\n"
+                         "   • Suspicious emails (auth failure): Spam/quarantine folder\n"
+                         "   • Fraudulent emails: Generally blocked\n"
+                         "✅ ADVANTAGES:\n"
+                         "   • Active protection against 80-90% of attacks\n"
+                         "   • Legitimate emails always delivered\n"
+                         "   • Secure transition period\n"
+                         "⚠️ LIMITATIONS:\n"
+                         "   • Fraudulent emails sometimes visible (spam folder)\n"
+                         "   • Users can access quarantines\n"
+                         "   • Protection not absolute\n"
+                         "🎯 STRATEGIC RECOMMENDATION:\n"
+                         "   • Excellent intermediate step\n"
+                         "   • Monitor reports for 4-8 weeks\n"
+                         "   • Evolve to p=reject for maximum protection\n"
+                         "📊 PROTECTION LEVEL: Very good (85-90%)",
+                         "DMARC_POLICY"),
+    "reject": Status("OK",
+                     "DMARC IN 'REJECT' MODE - MAXIMUM PROTECTION! 🛡️\n"
+                     "🏆 POLICY p=reject = Optimal configuration\n"
+                     "✅ PERFECT OPERATION:\n"
+                     "   • Legitimate emails (SPF/DKIM OK): Delivered normally\n"
+                     "   • Fraudulent emails: REJECTED before reception\n"
+                     "   • Spoofing: Impossible or nearly impossible\n"
+                     "🎯 MAXIMUM BUSINESS PROTECTION:\n"
+                     "   • Domain reputation preserved: 95%+\n"
+                     "   • Client trust maintained\n"
+                     "   • Phishing using your domain: blocked\n"
+                     "   • Security compliance: excellent\n"
+                     "💎 COMPETITIVE ADVANTAGES:\n"
+                     "   • Brand protected against abuse\n"
+                     "   • Security differentiation\n"
+                     "   • Reduced security incidents\n"
+                     "📊 PROTECTION LEVEL: Optimal (95-98%)\n"
+                     "🏅 CONGRATULATIONS: Exemplary DMARC configuration!",
+                     "DMARC_POLICY"),
+}
+
+# ----------------- Message templates -----------------
+# Fully-static messages live in the rule tables above; the messages below
+# embed runtime values, so they are kept as frozen module-level templates
+# and rendered with str.format at the call site. The interpreter folds
+# adjacent literals once at import instead of rebuilding them per call.
+
+_MSG_SPF_MISSING = (
+    "NO SPF RECORD FOUND! 🚨\n"
+    "💥 CRITICAL: No SPF protection in place\n"
+    "🎯 CONSEQUENCES:\n"
+    "   • Your domain can be spoofed by anyone\n"
+    "   • Major deliverability issues\n"
+    "   • Reputation and trust at risk\n"
+    "🛠️ FIX: Publish a valid SPF record in DNS\n"
+    "   Example: 'v=spf1 ip4:1.2.3.4 include:_spf.google.com -all'\n"
+    "📊 PRIORITY: URGENT (fix within hours)")
+
+_MSG_SPF_INVALID = (
+    "INVALID SPF RECORD! 🚨\n"
+    "💥 The SPF record is present but contains syntax or logic errors.\n"
+    "🎯 CONSEQUENCES:\n"
+    "   • SPF will be ignored by recipient servers\n"
+    "   • No protection against spoofing\n"
+    "   • Deliverability issues likely\n"
+    "🛠️ FIX: Validate and correct the SPF record using online tools\n"
+    "   Example: https://dmarcian.com/spf-survey/")
+
+_MSG_SPF_VALID = (
+    "SPF record is syntactically valid.\n"
+    "✅ Syntax and logic checks passed.")
+
+_TPL_SPF_LOOKUPS_CRITICAL = (
+    "SPF TOO COMPLEX - GUARANTEED FAILURE!\n"
+    "🔥 PROBLEM: {total} DNS lookups (RFC limit: 10 maximum)\n"
+    "   • Normal lookups: {lookups}\n"
+    "   • Void lookups: {void}\n"
+    "💥 DISASTROUS CONSEQUENCE: Servers return 'PermError' and COMPLETELY IGNORE your SPF!\n"
+    "⚠️ COMMON CAUSES:\n"
+    "   • Too many 'include:' statements\n"
+    "   • Complex redirection chains\n"
+    "   • Recursive inclusions\n"
+    "🛠️ IMMEDIATE SOLUTIONS:\n"
+    "   1. Replace 'include:' with direct IPs (ip4:/ip6:)\n"
+    "   2. Remove unnecessary inclusions\n"
+    "   3. Use subdomains to divide rules\n"
+    "📊 BUSINESS IMPACT: Zero protection + degraded deliverability!")
+
+_TPL_SPF_LOOKUPS_WARNING = (
+    "SPF CLOSE TO CRITICAL LIMIT!\n"
+    "⚠️ STATUS: {total}/10 DNS lookups used\n"
+    "   • Normal lookups: {lookups}\n"
+    "   • Void lookups: {void}\n"
+    "🎯 RISK: Limit exceeded with future additions\n"
+    "📈 TREND: Natural growth with infrastructure evolution\n"
+    "🔮 PREDICTION: SPF failure probable in 6-12 months\n"
+    "💡 PREVENTIVE RECOMMENDATION:\n"
+    "   • Optimize now (easier than emergency fixes)\n"
+    "   • Document necessary inclusions\n"
+    "   • Plan refactoring if > 8 lookups")
+
+_TPL_SPF_LOOKUPS_MODERATE = (
+    "SPF moderate complexity ({total}/10 DNS lookups)\n"
+    "   • Normal lookups: {lookups}\n"
+    "   • Void lookups: {void}\n"
+    "✅ STATUS: Functional and within standards\n"
+    "🎯 ADVICE: Monitor evolution with future additions\n"
+    "📋 MAINTENANCE: Review annually for optimization")
+
+_TPL_SPF_LOOKUPS_OK = (
+    "SPF OPTIMIZED! ({total}/10 DNS lookups)\n"
+    "   • Normal lookups: {lookups}\n"
+    "   • Void lookups: {void}\n"
+    "✅ PERFORMANCE: Excellent\n"
+    "🎯 MARGIN: Large margin for future evolution\n"
+    "🏆 STATUS: Optimal configuration")
+
+_MSG_DKIM_NOT_FOUND = (
+    "NO DKIM DETECTED IN SCAN! 🔍\n"
+    "⚠️ TECHNICAL LIMITATION: checkdmarc tests only one selector by default\n"
+    "🎯 STANDARD SELECTORS TESTED: 'default', 'selector1', 'dkim'\n"
+    "💡 POSSIBLE SITUATIONS:\n"
+    "   • DKIM exists but with a custom selector\n"
+    "   • Configured only on subdomains\n"
+    "   • DKIM keys being deployed\n"
+    "🔍 MANUAL VERIFICATION RECOMMENDED:\n"
+    "   1. Check outgoing email headers\n"
+    "   2. Look for 'DKIM-Signature:' in raw source\n"
+    "   3. Test custom selectors\n"
+    "📊 IMPACT: Incomplete authentication if truly absent")
+
+_TPL_DKIM_SELECTOR_MISSING = (
+    "DKIM SELECTOR '{selector}' TOTALLY ABSENT! 🚨\n"
+    "💥 DIRECT CONSEQUENCE: DKIM signature impossible to verify\n"
+    "⚡ AUTHENTICATION IMPACT:\n"
+    "   • Emails marked 'DKIM=fail' or 'DKIM=none'\n"
+    "   • DMARC cannot rely on DKIM\n"
+    "   • Protection against transit modification = ZERO\n"
+    "🎯 COMMON CAUSES:\n"
+    "   • Key accidentally deleted from DNS\n"
+    "   • Selector name error\n"
+    "   • Incomplete DNS propagation\n"
+    "🛠️ RESOLUTION:\n"
+    "   1. Check mail server configuration\n"
+    "   2. Regenerate DKIM key pair\n"
+    "   3. Publish public key in DNS TXT\n"
+    "📍 DNS Zone: {selector}._domainkey.yourdomain.com")
+
+_TPL_DKIM_INVALID = (
+    "DKIM '{selector}' INVALID! 🔴\n"
+    "💀 TECHNICAL ERROR: {error}\n"
+    "⚡ CONSEQUENCE: DKIM signature systematically rejected\n"
+    "🎯 DELIVERABILITY IMPACT:\n"
+    "   • Emails suspicious to recipient servers\n"
+    "   • Degraded reputation score\n"
+    "   • Increased risk of spam placement\n"
+    "🔧 TYPICAL CAUSES:\n"
+    "   • Incorrect public key format\n"
+    "   • Invalid characters in record\n"
+    "   • Corruption during DNS publication\n"
+    "🛠️ DIAGNOSIS: Validate DNS record with DKIM tools")
+
+_TPL_DKIM_KEY_CRITICAL = (
+    "DKIM KEY '{selector}' DANGEROUSLY SHORT! ⚠️\n"
+    "🔑 CURRENT SIZE: {key_size} bits (legal minimum: 1024 bits)\n"
+    "💀 MAJOR CRYPTOGRAPHIC VULNERABILITY:\n"
+    "   • Factorization possible in hours/days\n"
+    "   • Attackers can forge your DKIM signatures\n"
+    "   • Email spoofing with 'valid' authentication\n"
+    "🚨 POSSIBLE EXPLOITATION:\n"
+    "   • Undetectable phishing by filters\n"
+    "   • Total authentication compromise\n"
+    "⏰ IMMEDIATE ACTION REQUIRED:\n"
+    "   1. Generate new 2048+ bit pair\n"
+    "   2. Deploy new public key\n"
+    "   3. Update server configuration\n"
+    "   4. Test then remove old key\n"
+    "📊 PRIORITY: CRITICAL (major security risk)")
+
+_TPL_DKIM_KEY_WARNING = (
+    "DKIM KEY '{selector}' SUB-OPTIMAL 📏\n"
+    "🔑 CURRENT SIZE: {key_size} bits (recommended minimum: 2048 bits)\n"
+    "⚠️ REDUCED SECURITY:\n"
+    "   • Adequate protection today\n"
+    "   • Increasing vulnerability over time\n"
+    "   • Computing power constantly increasing\n"
+    "🎯 STRATEGIC RECOMMENDATION:\n"
+    "   • Plan migration to 2048 bits\n"
+    "   • New industry standard\n"
+    "   • Universal compatibility assured\n"
+    "📅 SUGGESTED TIMEFRAME: 6-12 months (not urgent but recommended)\n"
+    "🔐 2048 bits ADVANTAGE: 10+ years protection guaranteed")
+
+_TPL_DKIM_KEY_OK = (
+    "DKIM KEY '{selector}' EXCELLENT! 🏆\n"
+    "🔑 SIZE: {key_size} bits (modern standard)\n"
+    "✅ OPTIMAL CRYPTOGRAPHIC SECURITY:\n"
+    "   • Protection against factorization: 10+ years\n"
+    "   • Resistance to brute force attacks\n"
+    "   • Compliance with current standards\n"
+    "🎯 BUSINESS ADVANTAGES:\n"
+    "   • Robust email authentication\n"
+    "   • Guaranteed integrity in transit\n"
+    "   • Maximum recipient trust\n"
+    "   • Optimized deliverability\n"
+    "🏅 RESULT: Exemplary DKIM configuration!")
+
+_MSG_DMARC_MISSING = (
+    "DMARC TOTALLY ABSENT! 🚨\n"
+    "💥 CRITICAL SITUATION: No anti-spoofing policy\n"
+    "🎯 DISASTROUS CONSEQUENCES:\n"
+    "   • SPF and DKIM exist but are USELESS\n"
+    "   • No instruction on what to do with failures\n"
+    "   • Servers apply random policies\n"
+    "   • Spoofing is possible even with SPF/DKIM\n"
+    "💀 MAJOR BUSINESS IMPACT:\n"
+    "   • Phishing using your domain\n"
+    "   • Reputation destroyed by third-party spam\n"
+    "   • Loss of client/partner trust\n"
+    "   • Legal and financial risks\n"
+    "🆘 IMMEDIATE FIX:\n"
+    "   Publish: 'v=DMARC1; p=none; rua=mailto:dmarc@yourdomain.com'\n"
+    "📊 PRIORITY: URGENT (fix in hours, not days)")
+
+_TPL_DMARC_PCT_PARTIAL = (
+    "DMARC PARTIALLY APPLIED! ⚠️\n"
+    "📊 CURRENT PERCENTAGE: {pct}% of emails processed\n"
+    "🎯 MEANING:\n"
+    "   • {pct}% of emails: DMARC policy applied\n"
+    "   • {rest}% of emails: no policy (like p=none)\n"
+    "⚠️ PARTIAL DEPLOYMENT RISKS:\n"
+    "   • Attackers can exploit the unprotected {rest}%\n"
+    "   • Random and unpredictable protection\n"
+    "   • False sense of security\n"
+    "🎯 LEGITIMATE USE: Progressive transition to full protection\n"
+    "📈 RECOMMENDATION:\n"
+    "   1. If tests OK for several weeks: move to 100%\n"
+    "   2. If recent deployment: monitor and increase gradually\n"
+    "   3. Final goal: pct=100 for complete protection\n"
+    "⏰ RECOMMENDED DELAY: 4-8 weeks maximum in partial mode")
+
+_MSG_DMARC_PCT_FULL = (
+    "DMARC APPLIED AT 100%! ✅\n"
+    "🎯 COMPLETE COVERAGE: All your emails protected\n"
+    "🛡️ UNIFORM PROTECTION: No exploitable vulnerabilities\n"
+    "📊 RESULT: Maximum and predictable security")
+
+_MSG_DMARC_RUA_MISSING = (
+    "DMARC REPORTS NOT CONFIGURED! 📊\n"
+    "⚠️ PROBLEM: No 'rua' address specified\n"
+    "💀 CONSEQUENCE: You're flying blind!\n"
+    "🎯 MAJOR IMPACTS:\n"
+    "   • No visibility on spoofing attempts\n"
+    "   • Impossible to detect missing legitimate sources\n"
+    "   • No feedback on your policy effectiveness\n"
+    "   • Problem diagnosis: impossible\n"
+    "🔍 LOST DATA:\n"
+    "   • Volume of emails processed daily\n"
+    "   • Unauthorized sending sources\n"
+    "   • SPF/DKIM success rates\n"
+    "   • Geographic location of attacks\n"
+    "🛠️ IMMEDIATE SOLUTION:\n"
+    "   Add: rua=mailto:dmarc-reports@yourdomain.com\n"
+    "📈 BENEFIT: Complete visibility on email security")
+
+_MSG_DMARC_RUA_OK = (
+    "DMARC REPORTS CONFIGURED! 📊\n"
+    "✅ ACTIVE MONITORING: Data collected daily\n"
+    "🎯 OPERATIONAL ADVANTAGES:\n"
+    "   • Proactive detection of spoofing attempts\n"
+    "   • Monitoring of legitimate sending sources\n"
+    "   • Continuous configuration optimization\n"
+    "   • Evidence for security investigations\n"
+    "📊 RECOMMENDATION: Analyze reports monthly")
+
+def _classify_spf_lookups(total: int) -> int:
+    """Maps a DNS-lookup total onto its RFC 7208 severity tier (0-4)."""
+    if total > 10:
+        return 0
+    if total > 7:
+        return 1
+    if total > 5:
+        return 2
+    if total > 0:
+        return 3
+    return 4
+
+try:
+    # Pure integer comparisons: compiles to native code when numba is
+    # around, stays a plain function otherwise.
+    import numba  # type: ignore[import-not-found]
+    _classify_spf_lookups = numba.njit(cache=True)(_classify_spf_lookups)
+except ImportError:
+    pass
+
+# Tier index -> (level, template); tier 4 (zero lookups) emits nothing.
+_SPF_LOOKUP_TIERS = (
+    ("CRITICAL", _TPL_SPF_LOOKUPS_CRITICAL),
+    ("WARNING", _TPL_SPF_LOOKUPS_WARNING),
+    ("INFO", _TPL_SPF_LOOKUPS_MODERATE),
+    ("OK", _TPL_SPF_LOOKUPS_OK),
+    None,
+)
 
 # ----------------- ULTRA-DETAILED SPF ANALYSIS -----------------
 
-def analyze_spf(spf: dict) -> List[Status]:
-    out: List[Status] = []
-    
+def analyze_spf(spf: Dict[str, Any]) -> Iterator[Status]:
     if not spf or not spf.get("record"):
-        out.append(status("CRITICAL",
-                          "NO SPF RECORD FOUND! 🚨\n"
-                          "💥 CRITICAL: No SPF protection in place\n"
-                          "🎯 CONSEQUENCES:\n"
-                          "   • Your domain can be spoofed by anyone\n"
-                          "   • Major deliverability issues\n"
-                          "   • Reputation and trust at risk\n"
-                          "🛠️ FIX: Publish a valid SPF record in DNS\n"
-                          "   Example: 'v=spf1 ip4:1.2.3.4 include:_spf.google.com -all'\n"
-                          "📊 PRIORITY: URGENT (fix within hours)",
-                          "SPF_LIMIT"))
-        return out
+        yield Status("CRITICAL", _MSG_SPF_MISSING, "SPF_LIMIT")
+        return
+
+    # Load every field once up front instead of re-hashing the dict at each
+    # step of the analysis below.
+    record, valid, lookups, void = (spf["record"],
+                                    bool(spf.get("valid", False)),
+                                    spf.get("dns_lookups", 0),
+                                    spf.get("dns_void_lookups", 0))
+
+    # Organizational batch scans repeat the same records across subdomains,
+    # so the real work runs through a cache keyed on the normalized fields.
+    yield from _analyze_spf_record(record, valid, lookups, void)
+
+@functools.lru_cache(maxsize=4096)
+def _analyze_spf_record(record: str, valid: bool,
+                        dns_lookups: int, dns_void_lookups: int) -> Tuple[Status, ...]:
+    out: List[Status] = []
+
+    out.append(Status("INFO", f"📝 SPF record detected: {record}", "SPF_LIMIT"))
 
-    record = spf["record"]
-    out.append(status("INFO", f"📝 SPF record detected: {record}", "SPF_LIMIT"))
-    
     # Validity
-    if not spf.get("valid", False):
-        out.append(status("CRITICAL",
-                          "INVALID SPF RECORD! 🚨\n"
-                          "💥 The SPF record is present but contains syntax or logic errors.\n"
-                          "🎯 CONSEQUENCES:\n"
-                          "   • SPF will be ignored by recipient servers\n"
-                          "   • No protection against spoofing\n"
-                          "   • Deliverability issues likely\n"
-                          "🛠️ FIX: Validate and correct the SPF record using online tools\n"
-                          "   Example: https://dmarcian.com/spf-survey/",
-                          "SPF_LIMIT"))
+    if not valid:
+        out.append(Status("CRITICAL", _MSG_SPF_INVALID, "SPF_LIMIT"))
     else:
-        out.append(status("OK",
-                          "SPF record is syntactically valid.\n"
-                          "✅ Syntax and logic checks passed.",
-                          "SPF_LIMIT"))
+        out.append(Status("OK", _MSG_SPF_VALID, "SPF_LIMIT"))
 
     # DNS lookups analysis
-    dns_lookups = spf.get("dns_lookups", 0)
-    dns_void_lookups = spf.get("dns_void_lookups", 0)
     total_lookups = dns_lookups + dns_void_lookups
-    
-    if total_lookups > 10:
-        out.append(status("CRITICAL",
-                          f"SPF TOO COMPLEX - GUARANTEED FAILURE!\n"
-                          f"🔥 PROBLEM: {total_lookups} DNS lookups (RFC limit: 10 maximum)\n"
-                          f"   • Normal lookups: {dns_lookups}\n"
-                          f"   • Void lookups: {dns_void_lookups}\n"
-                          f"💥 DISASTROUS CONSEQUENCE: Servers return 'PermError' and COMPLETELY IGNORE your SPF!\n"
-                          f"⚠️ COMMON CAUSES:\n"
-                          f"   • Too many 'include:' statements\n"
-                          f"   • Complex redirection chains\n"
-                          f"   • Recursive inclusions\n"
-                          f"🛠️ IMMEDIATE SOLUTIONS:\n"
-                          f"   1. Replace 'include:' with direct IPs (ip4:/ip6:)\n"
-                          f"   2. Remove unnecessary inclusions\n"
-                          f"   3. Use subdomains to divide rules\n"
-                          f"📊 BUSINESS IMPACT: Zero protection + degraded deliverability!",
-                          "SPF_LIMIT"))
-    elif total_lookups > 7:
-        out.append(status("WARNING",
-                          f"SPF CLOSE TO CRITICAL LIMIT!\n"
-                          f"⚠️ STATUS: {total_lookups}/10 DNS lookups used\n"
-                          f"   • Normal lookups: {dns_lookups}\n"
-                          f"   • Void lookups: {dns_void_lookups}\n"
-                          f"🎯 RISK: Limit exceeded with future additions\n"
-                          f"📈 TREND: Natural growth with infrastructure evolution\n"
-                          f"🔮 PREDICTION: SPF failure probable in 6-12 months\n"
-                          f"💡 PREVENTIVE RECOMMENDATION:\n"
-                          f"   • Optimize now (easier than emergency fixes)\n"
-                          f"   • Document necessary inclusions\n"
-                          f"   • Plan refactoring if > 8 lookups",
-                          "SPF_LIMIT"))
-    elif total_lookups > 5:
-        out.append(status("INFO",
-                          f"SPF moderate complexity ({total_lookups}/10 DNS lookups)\n"
-                          f"   • Normal lookups: {dns_lookups}\n"
-                          f"   • Void lookups: {dns_void_lookups}\n"
-                          f"✅ STATUS: Functional and within standards\n"
-                          f"🎯 ADVICE: Monitor evolution with future additions\n"
-                          f"📋 MAINTENANCE: Review annually for optimization",
-                          "SPF_LIMIT"))
-    elif total_lookups > 0:
-        out.append(status("OK",
-                          f"SPF OPTIMIZED! ({total_lookups}/10 DNS lookups)\n"
-                          f"   • Normal lookups: {dns_lookups}\n"
-                          f"   • Void lookups: {dns_void_lookups}\n"
-                          f"✅ PERFORMANCE: Excellent\n"
-                          f"🎯 MARGIN: Large margin for future evolution\n"
-                          f"🏆 STATUS: Optimal configuration",
+
+    tier = _SPF_LOOKUP_TIERS[_classify_spf_lookups(total_lookups)]
+    if tier is not None:
+        level, template = tier
+        out.append(Status(level,
+                          template.format(total=total_lookups,
+                                          lookups=dns_lookups,
+                                          void=dns_void_lookups),
                           "SPF_LIMIT"))
 
     # ALL directive analysis (most important!)
-    if record and record.strip().endswith("-all"):
-        out.append(status("OK", 
-                          "MAXIMUM SPF PROTECTION ENABLED! 🛡️\n"
-                          "🎯 DIRECTIVE '-all' (FAIL) = Strictest policy\n"
-                          "✅ OPERATION:\n"
-                          "   • Authorized emails: ACCEPTED normally\n"
-                          "   • Unauthorized emails: REJECTED outright\n"
-                          "🏆 BUSINESS ADVANTAGES:\n"
-                          "   • Anti-spoofing protection: 95%+\n"
-                          "   • Enhanced client trust\n"
-                          "   • Domain reputation preserved\n"
-                          "   • Maximum security compliance\n"
-                          "📊 RESULT: Your domain is TRULY protected!",
-                          "SPF_ALL"))
-    elif record and "~all" in record:
-        out.append(status("WARNING",
-                          "PARTIAL SPF PROTECTION - MODERATE RISK ⚠️\n"
-                          "🎯 DIRECTIVE '~all' (SOFTFAIL) = Permissive policy\n"
-                          "⚡ RISKY OPERATION:\n"
-                          "   • Authorized emails: ACCEPTED normally\n"
-                          "   • Unauthorized emails: ACCEPTED but marked 'suspicious'\n"
-                          "🚨 FREQUENT PROBLEMS:\n"
-                          "   • Many servers IGNORE the marking\n"
-                          "   • Spoofing still possible\n"
-                          "   • False sense of security\n"
-                          "📈 STRATEGIC RECOMMENDATION:\n"
-                          "   1. Test '-all' mode on test domain\n"
-                          "   2. Monitor DMARC reports for 2-4 weeks\n"
-                          "   3. Switch to '-all' for real protection\n"
-                          "🎯 GOAL: 95% protection instead of 60%",
-                          "SPF_ALL"))
-    elif record and "+all" in record:
-        out.append(status("CRITICAL",
-                          "SUICIDAL SPF DIRECTIVE DETECTED! 💀\n"
-                          "🚨 DIRECTIVE '+all' (PASS) = SECURITY DISASTER\n"
-                          "💥 CATASTROPHIC OPERATION:\n"
-                          "   • ALL global servers authorized to send on your behalf\n"
-                          "   • Spammers, hackers, competitors: free access\n"
-                          "   • SPF turned into 'welcome fraudsters' sign\n"
-                          "🔥 IMMEDIATE CONSEQUENCES:\n"
-                          "   • Massive spoofing guaranteed\n"
-                          "   • Reputation destroyed within hours\n"
-                          "   • Blacklisting probable\n"
-                          "   • Client trust loss\n"
-                          "🆘 URGENT ACTION REQUIRED:\n"
-                          "   REPLACE '+all' with '-all' IMMEDIATELY!\n"
-                          "⏰ MAXIMUM DELAY: 1 hour (before malicious exploitation)",
-                          "SPF_ALL"))
-    elif record and "?all" in record:
-        out.append(status("WARNING",
-                          "SPF IN 'NEUTRAL' MODE - INEFFECTIVE! 🤷\n"
-                          "🎯 DIRECTIVE '?all' (NEUTRAL) = No opinion\n"
-                          "⚪ USELESS OPERATION:\n"
-                          "   • SPF says 'I don't know' for unauthorized\n"
-                          "   • Servers apply their local policy (unpredictable)\n"
-                          "   • Variable behavior depending on recipients\n"
-                          "📊 REAL PROTECTION: ~20% (random)\n"
-                          "🎭 PROBLEM: False sense of security\n"
-                          "🔧 SOLUTION: Choose '-all' or '~all' based on risk tolerance",
-                          "SPF_ALL"))
-    else:
-        if record:  # SPF exists but no 'all' directive
-            out.append(status("CRITICAL",
-                              "INCOMPLETE SPF - NO 'ALL' DIRECTIVE! 🕳️\n"
-                              "🚨 MAJOR PROBLEM: Truncated SPF record\n"
-                              "⚡ UNPREDICTABLE BEHAVIOR:\n"
-                              "   • Each server applies ITS default policy\n"
-                              "   • Gmail: may accept or reject\n"
-                              "   • Outlook: different behavior\n"
-                              "   • Private servers: totally random\n"
-                              "🎲 RESULT: Random protection (0-70%)\n"
-                              "🎯 DIAGNOSIS: Configuration error or truncated record\n"
-                              "🛠️ SIMPLE FIX: Add '-all' at end of record\n"
-                              "📝 EXAMPLE: 'v=spf1 ip4:1.2.3.4 include:_spf.google.com -all'",
-                              "SPF_ALL"))
-    
-    return out
+    out.append(_SPF_ALL_RULES[_classify_spf_all(record)])
+
+    return tuple(out)
 
 # ----------------- ULTRA-DETAILED DKIM ANALYSIS -----------------
 
-def analyze_dkim(dkim: dict) -> List[Status]:
-    out: List[Status] = []
-    
+# Key-size tiers shared by the scalar and vectorized paths:
+# bisect_right / searchsorted(side='right') both map
+# <1024 -> 0 (critical), 1024-2047 -> 1 (warning), >=2048 -> 2 (ok).
+_DKIM_KEY_THRESHOLDS = (1024, 2048)
+_DKIM_KEY_TIERS = (
+    ("CRITICAL", _TPL_DKIM_KEY_CRITICAL),
+    ("WARNING", _TPL_DKIM_KEY_WARNING),
+    ("OK", _TPL_DKIM_KEY_OK),
+)
+if np is not None:
+    _DKIM_KEY_THRESHOLDS_NP = np.array(_DKIM_KEY_THRESHOLDS, dtype=np.int64)
+
+def analyze_dkim(dkim: Dict[str, Any]) -> Iterator[Status]:
     if not dkim:
-        out.append(status("WARNING",
-                          "NO DKIM DETECTED IN SCAN! 🔍\n"
-                          "⚠️ TECHNICAL LIMITATION: checkdmarc tests only one selector by default\n"
-                          "🎯 STANDARD SELECTORS TESTED: 'default', 'selector1', 'dkim'\n"
-                          "💡 POSSIBLE SITUATIONS:\n"
-                          "   • DKIM exists but with a custom selector\n"
-                          "   • Configured only on subdomains\n"
-                          "   • DKIM keys being deployed\n"
-                          "🔍 MANUAL VERIFICATION RECOMMENDED:\n"
-                          "   1. Check outgoing email headers\n"
-                          "   2. Look for 'DKIM-Signature:' in raw source\n"
-                          "   3. Test custom selectors\n"
-                          "📊 IMPACT: Incomplete authentication if truly absent",
-                          "DKIM_LEN"))
-        return out
+        yield Status("WARNING", _MSG_DKIM_NOT_FOUND, "DKIM_LEN")
+        return
 
-    # Analysis of each DKIM selector
+    # Fleets sometimes publish tens of selectors: classify every key length
+    # in one numpy pass instead of a Python comparison ladder per selector.
+    if np is not None and len(dkim) >= 8:
+        yield from _analyze_dkim_batch(dkim)
+        return
+
+    # Analysis of each DKIM selector (cached: selectors like 'default' with
+    # the same key recur across the subdomains of one organization)
     for selector, det in dkim.items():
-        out.append(status("INFO", f"🔑 Analyzing DKIM selector: '{selector}'", "DKIM_LEN"))
-        
-        record = det.get("record")
+        # One block of lookups per selector, then locals only.
+        record, valid, error, key_size = (det.get("record"),
+                                          bool(det.get("valid", False)),
+                                          det.get('error', 'unknown error'),
+                                          det.get("key_length", 0))
+        yield from _analyze_dkim_selector(selector, record, valid, error, key_size)
+
+def _analyze_dkim_batch(dkim: Dict[str, Any]) -> List[Status]:
+    sizes = np.fromiter((det.get("key_length", 0) for det in dkim.values()),
+                        dtype=np.int64, count=len(dkim))
+    buckets = np.searchsorted(_DKIM_KEY_THRESHOLDS_NP, sizes, side='right')
+
+    out: List[Status] = []
+    for (selector, det), tier_index, key_size in zip(dkim.items(), buckets, sizes):
+        out.append(Status("INFO", f"🔑 Analyzing DKIM selector: '{selector}'", "DKIM_LEN"))
+
+        record, valid = det.get("record"), det.get("valid", False)
         if not record:
-            out.append(status("CRITICAL",
-                              f"DKIM SELECTOR '{selector}' TOTALLY ABSENT! 🚨\n"
-                              f"💥 DIRECT CONSEQUENCE: DKIM signature impossible to verify\n"
-                              f"⚡ AUTHENTICATION IMPACT:\n"
-                              f"   • Emails marked 'DKIM=fail' or 'DKIM=none'\n"
-                              f"   • DMARC cannot rely on DKIM\n"
-                              f"   • Protection against transit modification = ZERO\n"
-                              f"🎯 COMMON CAUSES:\n"
-                              f"   • Key accidentally deleted from DNS\n"
-                              f"   • Selector name error\n"
-                              f"   • Incomplete DNS propagation\n"
-                              f"🛠️ RESOLUTION:\n"
-                              f"   1. Check mail server configuration\n"
-                              f"   2. Regenerate DKIM key pair\n"
-                              f"   3. Publish public key in DNS TXT\n"
-                              f"📍 DNS Zone: {selector}._domainkey.yourdomain.com",
+            out.append(Status("CRITICAL",
+                              _TPL_DKIM_SELECTOR_MISSING.format(selector=selector),
                               "DKIM_LEN"))
             continue
 
-        if not det.get("valid", False):
-            error_detail = det.get('error', 'unknown error')
-            out.append(status("CRITICAL",
-                              f"DKIM '{selector}' INVALID! 🔴\n"
-                              f"💀 TECHNICAL ERROR: {error_detail}\n"
-                              f"⚡ CONSEQUENCE: DKIM signature systematically rejected\n"
-                              f"🎯 DELIVERABILITY IMPACT:\n"
-                              f"   • Emails suspicious to recipient servers\n"
-                              f"   • Degraded reputation score\n"
-                              f"   • Increased risk of spam placement\n"
-                              f"🔧 TYPICAL CAUSES:\n"
-                              f"   • Incorrect public key format\n"
-                              f"   • Invalid characters in record\n"
-                              f"   • Corruption during DNS publication\n"
-                              f"🛠️ DIAGNOSIS: Validate DNS record with DKIM tools",
+        if not valid:
+            out.append(Status("CRITICAL",
+                              _TPL_DKIM_INVALID.format(selector=selector,
+                                                       error=det.get('error', 'unknown error')),
                               "DKIM_LEN"))
             continue
 
-        # Key strength analysis
-        key_size = det.get("key_length", 0)
-        if key_size < 1024:
-            out.append(status("CRITICAL",
-                              f"DKIM KEY '{selector}' DANGEROUSLY SHORT! ⚠️\n"
-                              f"🔑 CURRENT SIZE: {key_size} bits (legal minimum: 1024 bits)\n"
-                              f"💀 MAJOR CRYPTOGRAPHIC VULNERABILITY:\n"
-                              f"   • Factorization possible in hours/days\n"
-                              f"   • Attackers can forge your DKIM signatures\n"
-                              f"   • Email spoofing with 'valid' authentication\n"
-                              f"🚨 POSSIBLE EXPLOITATION:\n"
-                              f"   • Undetectable phishing by filters\n"
-                              f"   • Total authentication compromise\n"
-                              f"⏰ IMMEDIATE ACTION REQUIRED:\n"
-                              f"   1. Generate new 2048+ bit pair\n"
-                              f"   2. Deploy new public key\n"
-                              f"   3. Update server configuration\n"
-                              f"   4. Test then remove old key\n"
-                              f"📊 PRIORITY: CRITICAL (major security risk)",
-                              "DKIM_LEN"))
-        elif key_size < 2048:
-            out.append(status("WARNING",
-                              f"DKIM KEY '{selector}' SUB-OPTIMAL 📏\n"
-                              f"🔑 CURRENT SIZE: {key_size} bits (recommended minimum: 2048 bits)\n"
-                              f"⚠️ REDUCED SECURITY:\n"
-                              f"   • Adequate protection today\n"
-                              f"   • Increasing vulnerability over time\n"
-                              f"   • Computing power constantly increasing\n"
-                              f"🎯 STRATEGIC RECOMMENDATION:\n"
-                              f"   • Plan migration to 2048 bits\n"
-                              f"   • New industry standard\n"
-                              f"   • Universal compatibility assured\n"
-                              f"📅 SUGGESTED TIMEFRAME: 6-12 months (not urgent but recommended)\n"
-                              f"🔐 2048 bits ADVANTAGE: 10+ years protection guaranteed",
-                              "DKIM_LEN"))
-        else:
-            out.append(status("OK",
-                              f"DKIM KEY '{selector}' EXCELLENT! 🏆\n"
-                              f"🔑 SIZE: {key_size} bits (modern standard)\n"
-                              f"✅ OPTIMAL CRYPTOGRAPHIC SECURITY:\n"
-                              f"   • Protection against factorization: 10+ years\n"
-                              f"   • Resistance to brute force attacks\n"
-                              f"   • Compliance with current standards\n"
-                              f"🎯 BUSINESS ADVANTAGES:\n"
-                              f"   • Robust email authentication\n"
-                              f"   • Guaranteed integrity in transit\n"
-                              f"   • Maximum recipient trust\n"
-                              f"   • Optimized deliverability\n"
-                              f"🏅 RESULT: Exemplary DKIM configuration!",
-                              "DKIM_LEN"))
-    
+        level, template = _DKIM_KEY_TIERS[tier_index]
+        out.append(Status(level,
+                          template.format(selector=selector, key_size=key_size),
+                          "DKIM_LEN"))
     return out
 
+@functools.lru_cache(maxsize=4096)
+def _analyze_dkim_selector(selector: str, record: Optional[str], valid: bool,
+                           error_detail: Optional[str], key_size: int) -> Tuple[Status, ...]:
+    out: List[Status] = []
+    out.append(Status("INFO", f"🔑 Analyzing DKIM selector: '{selector}'", "DKIM_LEN"))
+
+    if not record:
+        out.append(Status("CRITICAL",
+                          _TPL_DKIM_SELECTOR_MISSING.format(selector=selector),
+                          "DKIM_LEN"))
+        return tuple(out)
+
+    if not valid:
+        out.append(Status("CRITICAL",
+                          _TPL_DKIM_INVALID.format(selector=selector, error=error_detail),
+                          "DKIM_LEN"))
+        return tuple(out)
+
+    # Key strength analysis
+    level, template = _DKIM_KEY_TIERS[bisect.bisect_right(_DKIM_KEY_THRESHOLDS, key_size)]
+    out.append(Status(level,
+                      template.format(selector=selector, key_size=key_size),
+                      "DKIM_LEN"))
+
+    return tuple(out)
+
 # ----------------- ULTRA-DETAILED DMARC ANALYSIS -----------------
 
-def analyze_dmarc(dmarc: dict) -> List[Status]:
-    out: List[Status] = []
-    
+
+def analyze_dmarc(dmarc: Dict[str, Any]) -> Iterator[Status]:
     if not dmarc or not dmarc.get("record"):
-        out.append(status("CRITICAL",
-                          "DMARC TOTALLY ABSENT! 🚨\n"
-                          "💥 CRITICAL SITUATION: No anti-spoofing policy\n"
-                          "🎯 DISASTROUS CONSEQUENCES:\n"
-                          "   • SPF and DKIM exist but are USELESS\n"
-                          "   • No instruction on what to do with failures\n"
-                          "   • Servers apply random policies\n"
-                          "   • Spoofing is possible even with SPF/DKIM\n"
-                          "💀 MAJOR BUSINESS IMPACT:\n"
-                          "   • Phishing using your domain\n"
-                          "   • Reputation destroyed by third-party spam\n"
-                          "   • Loss of client/partner trust\n"
-                          "   • Legal and financial risks\n"
-                          "🆘 IMMEDIATE FIX:\n"
-                          "   Publish: 'v=DMARC1; p=none; rua=mailto:dmarc@yourdomain.com'\n"
-                          "📊 PRIORITY: URGENT (fix in hours, not days)",
-                          "DMARC_POLICY"))
-        return out
+        yield Status("CRITICAL", _MSG_DMARC_MISSING, "DMARC_POLICY")
+        return
+
+    # Fetch the tags dict once; every policy field hangs off it.
+    # RUA presence comes straight from the parsed tags (one hash lookup)
+    # rather than scanning checkdmarc's free-text warnings for "rua tag",
+    # so it no longer depends on upstream wording.
+    tags = dmarc["tags"]
+    pvalue = tags["p"]["value"]
+    pct = tags.get("pct", _EMPTY).get("value", 100)
+    has_rua = bool(tags.get("rua", _EMPTY).get("value"))
+
+    yield from _analyze_dmarc_record(dmarc["record"], pvalue, pct, has_rua)
+
+@functools.lru_cache(maxsize=4096)
+def _analyze_dmarc_record(record: str, pvalue: str, pct: int,
+                          has_rua: bool) -> Tuple[Status, ...]:
+    out: List[Status] = []
+    out.append(Status("INFO", f"📋 DMARC policy detected: {record}", "DMARC_POLICY"))
 
-    record = dmarc["record"]
-    out.append(status("INFO", f"📋 DMARC policy detected: {record}", "DMARC_POLICY"))
-    
     # Main policy analysis
-    pvalue = dmarc["tags"]["p"]["value"]
-    if pvalue == "none":
-        out.append(status("CRITICAL",
-                          "DMARC IN 'OBSERVATION' MODE ONLY! 👁️\n"
-                          "⚠️ POLICY p=none = No active protection\n"
-                          "📊 CURRENT OPERATION:\n"
-                          "   • Fraudulent emails: ACCEPTED without restriction\n"
-                          "   • Reports generated: YES (data collected)\n"
-                          "   • Corrective action: NONE\n"
-                          "🎯 LIMITED UTILITY:\n"
-                          "   ✅ Monitoring and flow analysis\n"
-                          "   ✅ Identification of missing legitimate sources\n"
-                          "   ❌ Zero protection against spoofing\n"
-                          "📈 RECOMMENDED PROGRESSION:\n"
-                          "   1. Analyze DMARC reports for 4-6 weeks\n"
-                          "   2. Identify missing legitimate sources\n"
-                          "   3. Fix SPF/DKIM if necessary\n"
-                          "   4. Move to p=quarantine then p=reject\n"
-                          "⏰ GOAL: Active protection within 2-3 months maximum",
-                          "DMARC_POLICY"))
-    elif pvalue == "quarantine":
-        out.append(status("WARNING",
-                          "DMARC IN 'QUARANTINE' MODE - PARTIAL PROTECTION ⚠️\n"
-                          "🎯 POLICY p=quarantine = Suspicious emails to spam\n"
-                          "📊 CURRENT OPERATION:\n"
-                          "   • Legitimate emails (SPF/DKIM OK): Inbox\n"
-                          "   • Suspicious emails (auth failure): Spam/quarantine folder\n"
-                          "   • Fraudulent emails: Generally blocked\n"
-                          "✅ ADVANTAGES:\n"
-                          "   • Active protection against 80-90% of attacks\n"
-                          "   • Legitimate emails always delivered\n"
-                          "   • Secure transition period\n"
-                          "⚠️ LIMITATIONS:\n"
-                          "   • Fraudulent emails sometimes visible (spam folder)\n"
-                          "   • Users can access quarantines\n"
-                          "   • Protection not absolute\n"
-                          "🎯 STRATEGIC RECOMMENDATION:\n"
-                          "   • Excellent intermediate step\n"
-                          "   • Monitor reports for 4-8 weeks\n"
-                          "   • Evolve to p=reject for maximum protection\n"
-                          "📊 PROTECTION LEVEL: Very good (85-90%)",
-                          "DMARC_POLICY"))
-    elif pvalue == "reject":
-        out.append(status("OK",
-                          "DMARC IN 'REJECT' MODE - MAXIMUM PROTECTION! 🛡️\n"
-                          "🏆 POLICY p=reject = Optimal configuration\n"
-                          "✅ PERFECT OPERATION:\n"
-                          "   • Legitimate emails (SPF/DKIM OK): Delivered normally\n"
-                          "   • Fraudulent emails: REJECTED before reception\n"
-                          "   • Spoofing: Impossible or nearly impossible\n"
-                          "🎯 MAXIMUM BUSINESS PROTECTION:\n"
-                          "   • Domain reputation preserved: 95%+\n"
-                          "   • Client trust maintained\n"
-                          "   • Phishing using your domain: blocked\n"
-                          "   • Security compliance: excellent\n"
-                          "💎 COMPETITIVE ADVANTAGES:\n"
-                          "   • Brand protected against abuse\n"
-                          "   • Security differentiation\n"
-                          "   • Reduced security incidents\n"
-                          "📊 PROTECTION LEVEL: Optimal (95-98%)\n"
-                          "🏅 CONGRATULATIONS: Exemplary DMARC configuration!",
-                          "DMARC_POLICY"))
+    policy_rule = _DMARC_POLICY_RULES.get(pvalue)
+    if policy_rule is not None:
+        out.append(policy_rule)
 
     # Application percentage analysis
-    pct = dmarc["tags"].get("pct", {}).get("value", 100)
     if pct < 100:
-        out.append(status("WARNING",
-                          f"DMARC PARTIALLY APPLIED! ⚠️\n"
-                          f"📊 CURRENT PERCENTAGE: {pct}% of emails processed\n"
-                          f"🎯 MEANING:\n"
-                          f"   • {pct}% of emails: DMARC policy applied\n"
-                          f"   • {100-pct}% of emails: no policy (like p=none)\n"
-                          f"⚠️ PARTIAL DEPLOYMENT RISKS:\n"
-                          f"   • Attackers can exploit the unprotected {100-pct}%\n"
-                          f"   • Random and unpredictable protection\n"
-                          f"   • False sense of security\n"
-                          f"🎯 LEGITIMATE USE: Progressive transition to full protection\n"
-                          f"📈 RECOMMENDATION:\n"
-                          f"   1. If tests OK for several weeks: move to 100%\n"
-                          f"   2. If recent deployment: monitor and increase gradually\n"
-                          f"   3. Final goal: pct=100 for complete protection\n"
-                          f"⏰ RECOMMENDED DELAY: 4-8 weeks maximum in partial mode",
+        out.append(Status("WARNING",
+                          _TPL_DMARC_PCT_PARTIAL.format(pct=pct, rest=100 - pct),
                           "DMARC_POLICY"))
     else:
-        out.append(status("OK",
-                          "DMARC APPLIED AT 100%! ✅\n"
-                          "🎯 COMPLETE COVERAGE: All your emails protected\n"
-                          "🛡️ UNIFORM PROTECTION: No exploitable vulnerabilities\n"
-                          "📊 RESULT: Maximum and predictable security",
-                          "DMARC_POLICY"))
+        out.append(Status("OK", _MSG_DMARC_PCT_FULL, "DMARC_POLICY"))
 
     # Aggregate reports analysis (RUA)
-    rua_warnings = dmarc.get("warnings", [])
-    has_rua_warning = any("rua tag" in warning for warning in rua_warnings)
-    
-    if has_rua_warning:
-        out.append(status("WARNING",
-                          "DMARC REPORTS NOT CONFIGURED! 📊\n"
-                          "⚠️ PROBLEM: No 'rua' address specified\n"
-                          "💀 CONSEQUENCE: You're flying blind!\n"
-                          "🎯 MAJOR IMPACTS:\n"
-                          "   • No visibility on spoofing attempts\n"
-                          "   • Impossible to detect missing legitimate sources\n"
-                          "   • No feedback on your policy effectiveness\n"
-                          "   • Problem diagnosis: impossible\n"
-                          "🔍 LOST DATA:\n"
-                          "   • Volume of emails processed daily\n"
-                          "   • Unauthorized sending sources\n"
-                          "   • SPF/DKIM success rates\n"
-                          "   • Geographic location of attacks\n"
-                          "🛠️ IMMEDIATE SOLUTION:\n"
-                          "   Add: rua=mailto:dmarc-reports@yourdomain.com\n"
-                          "📈 BENEFIT: Complete visibility on email security",
-                          "DMARC_POLICY"))
+    if has_rua:
+        out.append(Status("OK", _MSG_DMARC_RUA_OK, "DMARC_POLICY"))
     else:
-        out.append(status("OK",
-                          "DMARC REPORTS CONFIGURED! 📊\n"
-                          "✅ ACTIVE MONITORING: Data collected daily\n"
-                          "🎯 OPERATIONAL ADVANTAGES:\n"
-                          "   • Proactive detection of spoofing attempts\n"
-                          "   • Monitoring of legitimate sending sources\n"
-                          "   • Continuous configuration optimization\n"
-                          "   • Evidence for security investigations\n"
-                          "📊 RECOMMENDATION: Analyze reports monthly",
-                          "DMARC_POLICY"))
-    
-    return out
+        out.append(Status("WARNING", _MSG_DMARC_RUA_MISSING, "DMARC_POLICY"))
+
+    return tuple(out)
 
 # ----------------- ULTRA-DETAILED MTA-STS ANALYSIS -----------------
 
-def analyze_mta_sts(mta: dict) -> List[Status]:
-    out: List[Status] = []
-    
+# The explanation bodies below are static (at most one field varies), so
+# they are assembled once at import instead of from f-string pieces on
+# every audit. Fully static branches get a shared Status singleton.
+_TPL_MTA_STS_NOT_DEPLOYED = (
+    "MTA-STS NOT DEPLOYED! 🔐\n"
+    "📋 STATUS: {error}\n"
+    "⚠️ SECURITY IMPACT:\n"
+    "   • No protection against forced TLS downgrade\n"
+    "   • Vulnerable to man-in-the-middle attacks\n"
+    "   • Email encryption is optional (not guaranteed)\n"
+    "🎯 MTA-STS EXPLAINED:\n"
+    "   • Forces servers to use TLS (encryption)\n"
+    "   • Prevents downgrade to unencrypted connections\n"
+    "   • Validates recipient server certificates\n"
+    "💡 OPTIONAL BUT RECOMMENDED DEPLOYMENT:\n"
+    "   1. Create policy file at https://mta-sts.yourdomain.com\n"
+    "   2. Publish DNS record _mta-sts.yourdomain.com\n"
+    "   3. Set mode to 'enforce' after testing\n"
+    "📊 PRIORITY: Medium (enhanced security)")
+_TPL_MTA_STS_OK = (
+    "MTA-STS SUCCESSFULLY DEPLOYED! 🔐\n"
+    "🛡️ CURRENT MODE: {mode}\n"
+    "✅ TLS PROTECTION ENABLED:\n"
+    "   • Encrypted connections required\n"
+    "   • Prevention of downgrade attacks\n"
+    "   • Server certificate validation\n"
+    "🎯 SECURITY BENEFITS:\n"
+    "   • Emails protected in transit\n"
+    "   • Resistance to interception\n"
+    "   • Compliance with modern standards\n"
+    "📊 CONFIGURATION: Excellent (advanced standard)")
+
+def analyze_mta_sts(mta: Dict[str, Any]) -> Iterator[Status]:
     if not mta or not mta.get("valid", False):
         error_detail = mta.get('error', 'not deployed') if mta else 'not deployed'
-        out.append(status("WARNING",
-                          f"MTA-STS NOT DEPLOYED! 🔐\n"
-                          f"📋 STATUS: {error_detail}\n"
-                          f"⚠️ SECURITY IMPACT:\n"
-                          f"   • No protection against forced TLS downgrade\n"
-                          f"   • Vulnerable to man-in-the-middle attacks\n"
-                          f"   • Email encryption is optional (not guaranteed)\n"
-                          f"🎯 MTA-STS EXPLAINED:\n"
-                          f"   • Forces servers to use TLS (encryption)\n"
-                          f"   • Prevents downgrade to unencrypted connections\n"
-                          f"   • Validates recipient server certificates\n"
-                          f"💡 OPTIONAL BUT RECOMMENDED DEPLOYMENT:\n"
-                          f"   1. Create policy file at https://mta-sts.yourdomain.com\n"
-                          f"   2. Publish DNS record _mta-sts.yourdomain.com\n"
-                          f"   3. Set mode to 'enforce' after testing\n"
-                          f"📊 PRIORITY: Medium (enhanced security)",
-                          "MTA_STS"))
+        yield Status("WARNING",
+                     _TPL_MTA_STS_NOT_DEPLOYED.format(error=error_detail),
+                     "MTA_STS")
     else:
-        mode = mta.get("policy", {}).get("mode", "unknown")
-        out.append(status("OK",
-                          f"MTA-STS SUCCESSFULLY DEPLOYED! 🔐\n"
-                          f"🛡️ CURRENT MODE: {mode}\n"
-                          f"✅ TLS PROTECTION ENABLED:\n"
-                          f"   • Encrypted connections required\n"
-                          f"   • Prevention of downgrade attacks\n"
-                          f"   • Server certificate validation\n"
-                          f"🎯 SECURITY BENEFITS:\n"
-                          f"   • Emails protected in transit\n"
-                          f"   • Resistance to interception\n"
-                          f"   • Compliance with modern standards\n"
-                          f"📊 CONFIGURATION: Excellent (advanced standard)",
-                          "MTA_STS"))
-    
-    return out
+        mode = mta.get("policy", _EMPTY).get("mode", "unknown")
+        yield Status("OK", _TPL_MTA_STS_OK.format(mode=mode), "MTA_STS")
 
 # ----------------- ULTRA-DETAILED TLS-RPT ANALYSIS -----------------
 
-def analyze_tlsrpt(tls: dict) -> List[Status]:
-    out: List[Status] = []
-    
+_TLSRPT_NOT_CONFIGURED = Status("WARNING",
+    "TLS-RPT NOT CONFIGURED! 📊\n"
+    "⚠️ NO TLS MONITORING:\n"
+    "   • No visibility on encryption failures\n"
+    "   • TLS issues not detected automatically\n"
+    "   • Downgrade attacks invisible\n"
+    "🎯 TLS-RPT EXPLAINED:\n"
+    "   • Automatic reports on TLS failures\n"
+    "   • Proactive detection of delivery issues\n"
+    "   • Monitoring of transport security\n"
+    "💡 DEPLOYMENT BENEFITS:\n"
+    "   • Quick diagnosis of deliverability issues\n"
+    "   • Detection of interception attempts\n"
+    "   • Optimization of TLS configuration\n"
+    "🛠️ SIMPLE DEPLOYMENT:\n"
+    "   DNS record: _smtp._tls.yourdomain.com\n"
+    "   Value: v=TLSRPTv1; rua=mailto:tls-reports@yourdomain.com\n"
+    "📊 PRIORITY: Low (advanced monitoring)",
+    "TLS_RPT")
+_TLSRPT_CONFIGURED = Status("OK",
+    "TLS-RPT CONFIGURED! 📊\n"
+    "✅ ACTIVE TLS MONITORING:\n"
+    "   • Continuous monitoring of encryption failures\n"
+    "   • Automatic detection of issues\n"
+    "   • Detailed reports on TLS connections\n"
+    "🎯 OPERATIONAL BENEFITS:\n"
+    "   • Proactive resolution of delivery issues\n"
+    "   • Visibility into infrastructure health\n"
+    "   • Continuous security improvement\n"
+    "📊 CONFIGURATION: Advanced (proactive monitoring)",
+    "TLS_RPT")
+
+def analyze_tlsrpt(tls: Dict[str, Any]) -> Iterator[Status]:
     if not tls or not tls.get("valid", False):
-        out.append(status("WARNING",
-                          "TLS-RPT NOT CONFIGURED! 📊\n"
-                          "⚠️ NO TLS MONITORING:\n"
-                          "   • No visibility on encryption failures\n"
-                          "   • TLS issues not detected automatically\n"
-                          "   • Downgrade attacks invisible\n"
-                          "🎯 TLS-RPT EXPLAINED:\n"
-                          "   • Automatic reports on TLS failures\n"
-                          "   • Proactive detection of delivery issues\n"
-                          "   • Monitoring of transport security\n"
-                          "💡 DEPLOYMENT BENEFITS:\n"
-                          "   • Quick diagnosis of deliverability issues\n"
-                          "   • Detection of interception attempts\n"
-                          "   • Optimization of TLS configuration\n"
-                          "🛠️ SIMPLE DEPLOYMENT:\n"
-                          "   DNS record: _smtp._tls.yourdomain.com\n"
-                          "   Value: v=TLSRPTv1; rua=mailto:tls-reports@yourdomain.com\n"
-                          "📊 PRIORITY: Low (advanced monitoring)",
-                          "TLS_RPT"))
+        yield _TLSRPT_NOT_CONFIGURED
     else:
-        out.append(status("OK",
-                          "TLS-RPT CONFIGURED! 📊\n"
-                          "✅ ACTIVE TLS MONITORING:\n"
-                          "   • Continuous monitoring of encryption failures\n"
-                          "   • Automatic detection of issues\n"
-                          "   • Detailed reports on TLS connections\n"
-                          "🎯 OPERATIONAL BENEFITS:\n"
-                          "   • Proactive resolution of delivery issues\n"
-                          "   • Visibility into infrastructure health\n"
-                          "   • Continuous security improvement\n"
-                          "📊 CONFIGURATION: Advanced (proactive monitoring)",
-                          "TLS_RPT"))
-    
-    return out
+        yield _TLSRPT_CONFIGURED
 
 # ----------------- ULTRA-DETAILED DNSSEC ANALYSIS -----------------
 
-def analyze_dnssec(enabled: bool) -> List[Status]:
-    if enabled:
-        return [status("OK",
-                      "DNSSEC ENABLED - MAXIMUM DNS PROTECTION! 🔐\n"
-                      "✅ ENHANCED DNS SECURITY:\n"
-                      "   • Cryptographic authentication of DNS responses\n"
-                      "   • Protection against DNS cache poisoning\n"
-                      "   • Integrity guaranteed for SPF/DKIM/DMARC records\n"
-                      "🎯 CRITICAL ADVANTAGES:\n"
-                      "   • DNS spoofing attacks: impossible\n"
-                      "   • Malicious redirection: blocked\n"
-                      "   • Absolute trust in DNS resolutions\n"
-                      "🏆 BUSINESS IMPACT:\n"
-                      "   • Ultra-secure email infrastructure\n"
-                      "   • Protection against sophisticated attacks\n"
-                      "   • Compliance with advanced security standards\n"
-                      "📊 LEVEL: Security excellence (top 5% of domains)",
-                      "DNSSEC")]
-    
-    return [status("WARNING",
-                  "DNSSEC NOT DEPLOYED! 🔓\n"
-                  "⚠️ DNS VULNERABILITY:\n"
-                  "   • DNS responses not authenticated\n"
-                  "   • Risk of DNS cache poisoning\n"
-                  "   • Possibility of malicious redirection\n"
-                  "🎯 POSSIBLE ATTACKS:\n"
-                  "   • Hijacking of SPF/DKIM records\n"
-                  "   • Redirecting emails to malicious servers\n"
-                  "   • Compromising email authentication\n"
-                  "💡 DNSSEC EXPLAINED:\n"
-                  "   • Cryptographic signature of DNS zones\n"
-                  "   • Authenticity validation by resolvers\n"
-                  "   • Chain of trust from root servers\n"
-                  "🛠️ DEPLOYMENT:\n"
-                  "   • Contact registrar/DNS host\n"
-                  "   • Usually free activation\n"
-                  "   • Technical configuration required\n"
-                  "📊 PRIORITY: Medium (enhanced security)",
-                  "DNSSEC")]
+_DNSSEC_MISSING = Status("WARNING",
+    "DNSSEC NOT DEPLOYED! 🔓\n"
+    "⚠️ DNS VULNERABILITY:\n"
+    "   • DNS responses not authenticated\n"
+    "   • Risk of DNS cache poisoning\n"
+    "   • Possibility of malicious redirection\n"
+    "🎯 POSSIBLE ATTACKS:\n"
+    "   • Hijacking of SPF/DKIM records\n"
+    "   • Redirecting emails to malicious servers\n"
+    "   • Compromising email authentication\n"
+    "💡 DNSSEC EXPLAINED:\n"
+    "   • Cryptographic signature of DNS zones\n"
+    "   • Authenticity validation by resolvers\n"
+    "   • Chain of trust from root servers\n"
+    "🛠️ DEPLOYMENT:\n"
+    "   • Contact registrar/DNS host\n"
+    "   • Usually free activation\n"
+    "   • Technical configuration required\n"
+    "📊 PRIORITY: Medium (enhanced security)",
+    "DNSSEC")
+_DNSSEC_ENABLED = Status("OK",
+    "DNSSEC ENABLED - MAXIMUM DNS PROTECTION! 🔐\n"
+    "✅ ENHANCED DNS SECURITY:\n"
+    "   • Cryptographic authentication of DNS responses\n"
+    "   • Protection against DNS cache poisoning\n"
+    "   • Integrity guaranteed for SPF/DKIM/DMARC records\n"
+    "🎯 CRITICAL ADVANTAGES:\n"
+    "   • DNS spoofing attacks: impossible\n"
+    "   • Malicious redirection: blocked\n"
+    "   • Absolute trust in DNS resolutions\n"
+    "🏆 BUSINESS IMPACT:\n"
+    "   • Ultra-secure email infrastructure\n"
+    "   • Protection against sophisticated attacks\n"
+    "   • Compliance with advanced security standards\n"
+    "📊 LEVEL: Security excellence (top 5% of domains)",
+    "DNSSEC")
+
+def analyze_dnssec(enabled: bool) -> Iterator[Status]:
+    yield _DNSSEC_ENABLED if enabled else _DNSSEC_MISSING
 
 # ----------------- ULTRA-DETAILED BIMI ANALYSIS -----------------
 
-def analyze_bimi(bimi: dict, dmarc_policy: str) -> List[Status]:
-    out: List[Status] = []
-    
+# DMARC policies strong enough to satisfy BIMI / the strict-policy criteria.
+# A frozenset constant instead of a per-call ["reject", "quarantine"] literal:
+# CPython rebuilds mutable list literals on every evaluation.
+_STRICT_POLICIES = frozenset({"reject", "quarantine"})
+
+_BIMI_NOT_DEPLOYED = Status("INFO",
+    "BIMI NOT DEPLOYED (NORMAL) 🎨\n"
+    "📋 STATUS: Optional - Marketing impact only\n"
+    "🎯 BIMI EXPLAINED:\n"
+    "   • Brand Indicators for Message Identification\n"
+    "   • Displays your brand logo in email clients\n"
+    "   • Strengthens visual recognition of your emails\n"
+    "💡 MARKETING ADVANTAGES:\n"
+    "   • Improved brand recognition\n"
+    "   • Visual differentiation in inbox\n"
+    "   • Increased user trust\n"
+    "   • Reduced visual phishing\n"
+    "⚠️ STRICT PREREQUISITES:\n"
+    "   • DMARC with p=quarantine or p=reject REQUIRED\n"
+    "   • VMC (Verified Mark Certificate) required\n"
+    "   • Logo in specific SVG format\n"
+    "📊 PRIORITY: Very low (cosmetic/marketing)",
+    "BIMI")
+_TPL_BIMI_INVALID = (
+    "BIMI INVALID! 🎨\n"
+    "🔴 ERROR: {error}\n"
+    "⚠️ CONSEQUENCE: Logo not displayed in email clients\n"
+    "🎯 COMMON CAUSES:\n"
+    "   • SVG format not compliant with specifications\n"
+    "   • Logo URL inaccessible or incorrect\n"
+    "   • VMC certificate missing or invalid\n"
+    "   • Incorrect DNS record syntax\n"
+    "🛠️ RECOMMENDED DIAGNOSIS:\n"
+    "   1. Validate SVG format with BIMI tools\n"
+    "   2. Check logo URL accessibility\n"
+    "   3. Check VMC certificate validity\n"
+    "📊 IMPACT: Cosmetic only (not security)")
+_BIMI_OK = Status("OK",
+    "BIMI SUCCESSFULLY CONFIGURED! 🎨\n"
+    "✅ BRAND LOGO ACTIVE:\n"
+    "   • Logo displayed in Gmail, Yahoo, etc.\n"
+    "   • Enhanced visual identity\n"
+    "   • Premium differentiation in inboxes\n"
+    "🎯 MARKETING BENEFITS ACHIEVED:\n"
+    "   • Immediate recognition of your emails\n"
+    "   • Increased recipient trust\n"
+    "   • Protection against visual spoofing\n"
+    "📊 STATUS: Optimal marketing configuration",
+    "BIMI")
+_TPL_BIMI_WEAK_DMARC = (
+    "BIMI WITHOUT STRICT DMARC! ⚠️\n"
+    "🚨 PROBLEM: DMARC in mode '{policy}' (required: quarantine/reject)\n"
+    "💀 CONSEQUENCE: BIMI logo ignored by most clients\n"
+    "🎯 TECHNICAL EXPLANATION:\n"
+    "   • BIMI requires strong anti-spoofing protection\n"
+    "   • Gmail/Yahoo refuse to display logos without strict DMARC\n"
+    "   • BIMI investment wasted without prior protection\n"
+    "🛠️ FIX:\n"
+    "   1. Change DMARC to p=quarantine or p=reject\n"
+    "   2. Wait for propagation (24-48h)\n"
+    "   3. BIMI will work automatically\n"
+    "📊 PRIORITY: Medium (fix DMARC first)")
+
+def analyze_bimi(bimi: Dict[str, Any], dmarc_policy: str) -> Iterator[Status]:
     if not bimi or not bimi.get("record"):
-        out.append(status("INFO",
-                          "BIMI NOT DEPLOYED (NORMAL) 🎨\n"
-                          "📋 STATUS: Optional - Marketing impact only\n"
-                          "🎯 BIMI EXPLAINED:\n"
-                          "   • Brand Indicators for Message Identification\n"
-                          "   • Displays your brand logo in email clients\n"
-                          "   • Strengthens visual recognition of your emails\n"
-                          "💡 MARKETING ADVANTAGES:\n"
-                          "   • Improved brand recognition\n"
-                          "   • Visual differentiation in inbox\n"
-                          "   • Increased user trust\n"
-                          "   • Reduced visual phishing\n"
-                          "⚠️ STRICT PREREQUISITES:\n"
-                          "   • DMARC with p=quarantine or p=reject REQUIRED\n"
-                          "   • VMC (Verified Mark Certificate) required\n"
-                          "   • Logo in specific SVG format\n"
-                          "📊 PRIORITY: Very low (cosmetic/marketing)",
-                          "BIMI"))
-        return out
+        yield _BIMI_NOT_DEPLOYED
+        return
 
     if not bimi.get("valid", False):
         error_detail = bimi.get('error', 'invalid configuration')
-        out.append(status("WARNING",
-                          f"BIMI INVALID! 🎨\n"
-                          f"🔴 ERROR: {error_detail}\n"
-                          f"⚠️ CONSEQUENCE: Logo not displayed in email clients\n"
-                          f"🎯 COMMON CAUSES:\n"
-                          f"   • SVG format not compliant with specifications\n"
-                          f"   • Logo URL inaccessible or incorrect\n"
-                          f"   • VMC certificate missing or invalid\n"
-                          f"   • Incorrect DNS record syntax\n"
-                          f"🛠️ RECOMMENDED DIAGNOSIS:\n"
-                          f"   1. Validate SVG format with BIMI tools\n"
-                          f"   2. Check logo URL accessibility\n"
-                          f"   3. Check VMC certificate validity\n"
-                          f"📊 IMPACT: Cosmetic only (not security)",
-                          "BIMI"))
+        yield Status("WARNING",
+                     _TPL_BIMI_INVALID.format(error=error_detail),
+                     "BIMI")
     else:
-        out.append(status("OK",
-                          "BIMI SUCCESSFULLY CONFIGURED! 🎨\n"
-                          "✅ BRAND LOGO ACTIVE:\n"
-                          "   • Logo displayed in Gmail, Yahoo, etc.\n"
-                          "   • Enhanced visual identity\n"
-                          "   • Premium differentiation in inboxes\n"
-                          "🎯 MARKETING BENEFITS ACHIEVED:\n"
-                          "   • Immediate recognition of your emails\n"
-                          "   • Increased recipient trust\n"
-                          "   • Protection against visual spoofing\n"
-                          "📊 STATUS: Optimal marketing configuration",
-                          "BIMI"))
+        yield _BIMI_OK
 
     # DMARC prerequisite check for BIMI
-    if dmarc_policy not in ["reject", "quarantine"]:
-        out.append(status("WARNING",
-                          "BIMI WITHOUT STRICT DMARC! ⚠️\n"
-                          f"🚨 PROBLEM: DMARC in mode '{dmarc_policy}' (required: quarantine/reject)\n"
-                          "💀 CONSEQUENCE: BIMI logo ignored by most clients\n"
-                          "🎯 TECHNICAL EXPLANATION:\n"
-                          "   • BIMI requires strong anti-spoofing protection\n"
-                          "   • Gmail/Yahoo refuse to display logos without strict DMARC\n"
-                          "   • BIMI investment wasted without prior protection\n"
-                          "🛠️ FIX:\n"
-                          "   1. Change DMARC to p=quarantine or p=reject\n"
-                          "   2. Wait for propagation (24-48h)\n"
-                          "   3. BIMI will work automatically\n"
-                          "📊 PRIORITY: Medium (fix DMARC first)",
-                          "BIMI"))
-    
-    return out
+    if dmarc_policy not in _STRICT_POLICIES:
+        yield Status("WARNING",
+                     _TPL_BIMI_WEAK_DMARC.format(policy=dmarc_policy),
+                     "BIMI")
 
 # ----------------- ULTRA-DETAILED MX AND STARTTLS ANALYSIS -----------------
 
-def analyze_mx_starttls(mx: dict) -> List[Status]:
-    """Analyzes MX servers and their STARTTLS capabilities"""
-    out: List[Status] = []
-    
+class _Derived(NamedTuple):
+    """Aggregates needed by more than one analyzer, computed in a single
+    pass over the report instead of being re-derived per section (the MX
+    host list alone used to be walked twice per audit)."""
+    mx_host_count: int
+    starttls_count: int
+    dmarc_policy: str
+
+def _derive(report: Dict[str, Any]) -> _Derived:
+    hosts = report.get("mx", _EMPTY).get("hosts") or []
+    starttls = sum(1 for host in hosts if host.get("starttls", False))
+    return _Derived(len(hosts), starttls, _dmarc_policy(report))
+
+def analyze_mx_starttls(mx: Dict[str, Any], derived: _Derived,
+                        verbose: bool = True) -> Iterator[Status]:
+    """Analyzes MX servers and their STARTTLS capabilities.
+
+    With verbose=False the per-host INFO lines are skipped entirely (the
+    Excel path never shows them, so workers shouldn't build the strings).
+    """
+
     if not mx or not mx.get("hosts"):
-        out.append(status("CRITICAL",
-                          "NO MX SERVERS CONFIGURED!\n"
-                          "🚨 CRITICAL PROBLEM: Unable to receive emails\n"
-                          "💥 IMMEDIATE CONSEQUENCES:\n"
-                          "   • Incoming emails permanently lost\n"
-                          "   • Client communications interrupted\n"
-                          "   • Loss of business opportunities\n"
-                          "   • Professional reputation damaged\n"
-                          "🛠️ URGENT FIX:\n"
-                          "   Configure at least one MX record\n"
-                          "   Example: '10 mail.yourdomain.com'",
-                          "SPF_LIMIT"))
-        return out
+        yield Status("CRITICAL",
+                     "NO MX SERVERS CONFIGURED!\n"
+                     "🚨 CRITICAL PROBLEM: Unable to receive emails\n"
+                     "💥 IMMEDIATE CONSEQUENCES:\n"
+                     "   • Incoming emails permanently lost\n"
+                     "   • Client communications interrupted\n"
+                     "   • Loss of business opportunities\n"
+                     "   • Professional reputation damaged\n"
+                     "🛠️ URGENT FIX:\n"
+                     "   Configure at least one MX record\n"
+                     "   Example: '10 mail.yourdomain.com'",
+                     "MX")
+        return
 
     hosts = mx.get("hosts", [])
-    out.append(status("INFO", f"📧 {len(hosts)} MX server(s) configured", "MTA_STS"))
-    
-    starttls_supported = 0
-    starttls_failed = 0
-    connection_issues = 0
-    
-    for i, host in enumerate(hosts):
-        hostname = host.get("hostname", "unknown")
-        preference = host.get("preference", 0)
-        starttls = host.get("starttls", False)
-        addresses = host.get("addresses", [])
-        
-        out.append(status("INFO", 
-                          f"🖥️ MX Server #{i+1}: {hostname} (priority: {preference})\n"
-                          f"   📍 IP Addresses: {', '.join(addresses) if addresses else 'Unresolved'}\n"
-                          f"   🔐 STARTTLS: {'✅ Supported' if starttls else '❌ Not supported'}",
-                          "MTA_STS"))
-        
-        if starttls:
-            starttls_supported += 1
-        else:
-            starttls_failed += 1
-    
+    yield Status("INFO", f"📧 {len(hosts)} MX server(s) configured", "MX")
+
+    # The STARTTLS tally was already computed in the shared derivation pass.
+    starttls_supported = derived.starttls_count
+    starttls_failed = derived.mx_host_count - starttls_supported
+
+    if verbose:
+        for i, host in enumerate(hosts):
+            hostname = host.get("hostname", "unknown")
+            preference = host.get("preference", 0)
+            starttls = host.get("starttls", False)
+            addresses = host.get("addresses", [])
+
+            yield Status("INFO",
+                         f"🖥️ MX Server #{i+1}: {hostname} (priority: {preference})\n"
+                         f"   📍 IP Addresses: {', '.join(addresses) if addresses else 'Unresolved'}\n"
+                         f"   🔐 STARTTLS: {'✅ Supported' if starttls else '❌ Not supported'}",
+                         "MX")
+
     # Connection warnings
     warnings = mx.get("warnings", [])
     if warnings:
-        connection_issues = len([w for w in warnings if "Connection" in w or "timed out" in w])
-        out.append(status("WARNING",
-                          f"CONNECTIVITY ISSUES DETECTED! ⚠️\n"
-                          f"🚨 {len(warnings)} MX server(s) unreachable\n"
-                          f"📝 Details:\n" + "\n".join([f"   • {w}" for w in warnings]) + "\n"
-                          f"💡 POSSIBLE CAUSES:\n"
-                          f"   • Servers temporarily offline\n"
-                          f"   • Firewall blocking SMTP connections\n"
-                          f"   • Incorrect DNS configuration\n"
-                          f"   • Maintenance in progress\n"
-                          f"🔧 RECOMMENDED ACTIONS:\n"
-                          f"   1. Check server status with IT team\n"
-                          f"   2. Test SMTP connectivity manually\n"
-                          f"   3. Check firewall rules",
-                          "MTA_STS"))
+        # One join pass with the bullet in the separator — no temporary
+        # list of per-warning f-strings.
+        details = "   • " + "\n   • ".join(warnings)
+        yield Status("WARNING",
+                     f"CONNECTIVITY ISSUES DETECTED! ⚠️\n"
+                     f"🚨 {len(warnings)} MX server(s) unreachable\n"
+                     f"📝 Details:\n{details}\n"
+                     f"💡 POSSIBLE CAUSES:\n"
+                     f"   • Servers temporarily offline\n"
+                     f"   • Firewall blocking SMTP connections\n"
+                     f"   • Incorrect DNS configuration\n"
+                     f"   • Maintenance in progress\n"
+                     f"🔧 RECOMMENDED ACTIONS:\n"
+                     f"   1. Check server status with IT team\n"
+                     f"   2. Test SMTP connectivity manually\n"
+                     f"   3. Check firewall rules",
+                     "MX")
 
     # Global STARTTLS analysis
     if starttls_failed == 0 and starttls_supported > 0:
-        out.append(status("OK",
-                          "STARTTLS PERFECTLY CONFIGURED! 🔐\n"
-                          f"✅ ALL MX servers ({starttls_supported}/{len(hosts)}) support STARTTLS\n"
-                          "🛡️ OPTIMAL PROTECTION:\n"
-                          "   • Incoming emails encrypted in transit\n"
-                          "   • Protection against interception\n"
-                          "   • Maximum security compliance\n"
-                          "🏆 ACHIEVED BENEFITS:\n"
-                          "   • Communication confidentiality\n"
-                          "   • Regulatory compliance (GDPR, etc.)\n"
-                          "   • Increased partner trust",
-                          "MTA_STS"))
+        yield Status("OK",
+                     "STARTTLS PERFECTLY CONFIGURED! 🔐\n"
+                     f"✅ ALL MX servers ({starttls_supported}/{len(hosts)}) support STARTTLS\n"
+                     "🛡️ OPTIMAL PROTECTION:\n"
+                     "   • Incoming emails encrypted in transit\n"
+                     "   • Protection against interception\n"
+                     "   • Maximum security compliance\n"
+                     "🏆 ACHIEVED BENEFITS:\n"
+                     "   • Communication confidentiality\n"
+                     "   • Regulatory compliance (GDPR, etc.)\n"
+                     "   • Increased partner trust",
+                     "MX")
     elif starttls_supported > 0:
-        out.append(status("WARNING",
-                          f"STARTTLS PARTIALLY SUPPORTED! ⚠️\n"
-                          f"📊 STATUS: {starttls_supported}/{len(hosts)} servers support STARTTLS\n"
-                          f"🚨 RISK: Unencrypted emails on some servers\n"
-                          f"💡 PROBLEM: Heterogeneous configuration\n"
-                          f"🎯 SECURITY IMPACT:\n"
-                          f"   • Potential interception vulnerability\n"
-                          f"   • Partial non-compliance\n"
-                          f"   • Risk depends on server used\n"
-                          f"🛠️ FIX:\n"
-                          f"   Enable STARTTLS on ALL MX servers",
-                          "MTA_STS"))
+        yield Status("WARNING",
+                     f"STARTTLS PARTIALLY SUPPORTED! ⚠️\n"
+                     f"📊 STATUS: {starttls_supported}/{len(hosts)} servers support STARTTLS\n"
+                     f"🚨 RISK: Unencrypted emails on some servers\n"
+                     f"💡 PROBLEM: Heterogeneous configuration\n"
+                     f"🎯 SECURITY IMPACT:\n"
+                     f"   • Potential interception vulnerability\n"
+                     f"   • Partial non-compliance\n"
+                     f"   • Risk depends on server used\n"
+                     f"🛠️ FIX:\n"
+                     f"   Enable STARTTLS on ALL MX servers",
+                     "MX")
     else:
-        out.append(status("CRITICAL",
-                          "NO MX SERVER SUPPORTS STARTTLS! 🚨\n"
-                          "💥 ALL incoming emails are unencrypted in transit\n"
-                          "⚠️ MAJOR RISK: Susceptible to interception and eavesdropping\n"
-                          "🛠️ FIX: Enable STARTTLS on all MX servers as soon as possible",
-                          "MTA_STS"))
+        yield Status("CRITICAL",
+                     "NO MX SERVER SUPPORTS STARTTLS! 🚨\n"
+                     "💥 ALL incoming emails are unencrypted in transit\n"
+                     "⚠️ MAJOR RISK: Susceptible to interception and eavesdropping\n"
+                     "🛠️ FIX: Enable STARTTLS on all MX servers as soon as possible",
+                     "MX")
     
-    return out
 
 # ----------------- SPECIFIC SECURITY CRITERIA ANALYSIS -----------------
 
-def analyze_security_criteria(report: dict) -> List[Status]:
+# (pass, fail) Status pairs for the criteria whose wording is fully static,
+# built once at import. The criteria that interpolate observed values
+# (4, 5, 8, 9) keep their branches in the function body.
+_CRITERIA_INTRO = Status("INFO", "📋 CHECKING SPECIFIC SECURITY CRITERIA", "SPF_ALL")
+_CRITERIA_HEAD: Final[Tuple[Tuple[Status, Status], ...]] = (
+    # 1. SPF record present and valid
+    (Status("OK", "SPF record present and valid.", "SPF_ALL"),
+     Status("CRITICAL", "SPF record missing or invalid!", "SPF_ALL")),
+    # 2. SPF strict mode (-all)
+    (Status("OK", "SPF strict mode (-all) is enabled.", "SPF_ALL"),
+     Status("WARNING", "SPF strict mode (-all) is not enabled.", "SPF_ALL")),
+    # 3. DMARC record present and valid
+    (Status("OK", "DMARC record present and valid.", "DMARC_POLICY"),
+     Status("CRITICAL", "DMARC record missing or invalid!", "DMARC_POLICY")),
+)
+_CRIT_RUA = (Status("OK", "✅ CRITERION 6/10: RUA address (aggregate reports) configured", "DMARC_POLICY"),
+             Status("CRITICAL", "❌ CRITERION 6/10: RUA address (aggregate reports) missing", "DMARC_POLICY"))
+_CRIT_RUF = (Status("OK", "✅ CRITERION 7/10: RUF address (detailed reports) configured", "DMARC_POLICY"),
+             Status("WARNING", "⚠️ CRITERION 7/10: RUF address (detailed reports) missing", "DMARC_POLICY"))
+_CRIT_PCT_FULL = Status("OK", "✅ CRITERION 8/10: DMARC applied to 100% of traffic (pct=100)", "DMARC_POLICY")
+_CRIT_POP = Status("INFO", "ℹ️ CRITERION 10/10: POP service (requires manual verification)", "MX")
+
+def analyze_security_criteria(report: Dict[str, Any],
+                              derived: _Derived) -> Iterator[Status]:
     """Checks the 10 specific security criteria from criteria.txt"""
-    out: List[Status] = []
-    
-    out.append(status("INFO", "📋 CHECKING SPECIFIC SECURITY CRITERIA", "SPF_ALL"))
-    
-    # 1. SPF - SPF record present
-    spf = report.get("spf", {})
-    if spf.get("record") and spf.get("valid", False):
-        out.append(status("OK", "SPF record present and valid.", "SPF_ALL"))
-    else:
-        out.append(status("CRITICAL", "SPF record missing or invalid!", "SPF_ALL"))
-    
-    # 2. SPF - Strict mode (checks if -all is used)
+
+    yield _CRITERIA_INTRO
+
+    spf = report.get("spf", _EMPTY)
+    dmarc = report.get("dmarc", _EMPTY)
     spf_record = spf.get("record", "") or ""
-    if spf_record.strip().endswith("-all"):
-        out.append(status("OK", "SPF strict mode (-all) is enabled.", "SPF_ALL"))
-    else:
-        out.append(status("WARNING", "SPF strict mode (-all) is not enabled.", "SPF_ALL"))
-    
-    # 3. DMARC - DMARC record present
-    dmarc = report.get("dmarc", {})
-    if dmarc.get("record") and dmarc.get("valid", False):
-        out.append(status("OK", "DMARC record present and valid.", "DMARC_POLICY"))
-    else:
-        out.append(status("CRITICAL", "DMARC record missing or invalid!", "DMARC_POLICY"))
-    
+
+    # Criteria 1-3 as a truth table: compute the booleans in one
+    # straight-line block, then index the pre-built (pass, fail) pairs.
+    flags = (bool(spf.get("record")) and bool(spf.get("valid", False)),
+             spf_record.strip().endswith("-all"),
+             bool(dmarc.get("record")) and bool(dmarc.get("valid", False)))
+    for (passed, failed), ok in zip(_CRITERIA_HEAD, flags):
+        yield passed if ok else failed
+
     # 4. DMARC - Policy is not none
-    dmarc_policy = dmarc.get("tags", {}).get("p", {}).get("value", "none")
-    if dmarc_policy in ["quarantine", "reject"]:
-        out.append(status("OK", f"✅ CRITERION 4/10: Strict DMARC policy (p={dmarc_policy})", "DMARC_POLICY"))
+    dmarc_tags = dmarc.get("tags", _EMPTY)
+    dmarc_policy = derived.dmarc_policy
+    if dmarc_policy in _STRICT_POLICIES:
+        yield Status("OK", f"✅ CRITERION 4/10: Strict DMARC policy (p={dmarc_policy})", "DMARC_POLICY")
     else:
-        out.append(status("CRITICAL", f"❌ CRITERION 4/10: Non-strict DMARC policy (p={dmarc_policy})", "DMARC_POLICY"))
+        yield Status("CRITICAL", f"❌ CRITERION 4/10: Non-strict DMARC policy (p={dmarc_policy})", "DMARC_POLICY")
     
     # 5. DMARC - Strict mode (checks if p=reject)
     if dmarc_policy == "reject":
-        out.append(status("OK", "✅ CRITERION 5/10: DMARC in maximum strict mode (p=reject)", "DMARC_POLICY"))
+        yield Status("OK", "✅ CRITERION 5/10: DMARC in maximum strict mode (p=reject)", "DMARC_POLICY")
     elif dmarc_policy == "quarantine":
-        out.append(status("WARNING", "⚠️ CRITERION 5/10: DMARC moderately strict (p=quarantine, recommended: p=reject)", "DMARC_POLICY"))
+        yield Status("WARNING", "⚠️ CRITERION 5/10: DMARC moderately strict (p=quarantine, recommended: p=reject)", "DMARC_POLICY")
     else:
-        out.append(status("CRITICAL", f"❌ CRITERION 5/10: DMARC not in strict mode (p={dmarc_policy})", "DMARC_POLICY"))
+        yield Status("CRITICAL", f"❌ CRITERION 5/10: DMARC not in strict mode (p={dmarc_policy})", "DMARC_POLICY")
     
     # 6. DMARC - rua present (aggregate reports)
-    if "rua" in dmarc.get("tags", {}):
-        out.append(status("OK", "✅ CRITERION 6/10: RUA address (aggregate reports) configured", "DMARC_POLICY"))
-    else:
-        out.append(status("CRITICAL", "❌ CRITERION 6/10: RUA address (aggregate reports) missing", "DMARC_POLICY"))
-    
+    yield _CRIT_RUA[0] if "rua" in dmarc_tags else _CRIT_RUA[1]
+
     # 7. DMARC - ruf present (detailed reports)
-    if "ruf" in dmarc.get("tags", {}):
-        out.append(status("OK", "✅ CRITERION 7/10: RUF address (detailed reports) configured", "DMARC_POLICY"))
-    else:
-        out.append(status("WARNING", "⚠️ CRITERION 7/10: RUF address (detailed reports) missing", "DMARC_POLICY"))
-    
+    yield _CRIT_RUF[0] if "ruf" in dmarc_tags else _CRIT_RUF[1]
+
     # 8. DMARC - pct equals 100
-    dmarc_pct = dmarc.get("tags", {}).get("pct", {}).get("value", 0)
+    dmarc_pct = dmarc_tags.get("pct", _EMPTY).get("value", 0)
     if dmarc_pct == 100:
-        out.append(status("OK", "✅ CRITERION 8/10: DMARC applied to 100% of traffic (pct=100)", "DMARC_POLICY"))
+        yield _CRIT_PCT_FULL
     else:
-        out.append(status("WARNING", f"⚠️ CRITERION 8/10: Partial DMARC (pct={dmarc_pct}%, recommended: 100%)", "DMARC_POLICY"))
+        yield Status("WARNING", f"⚠️ CRITERION 8/10: Partial DMARC (pct={dmarc_pct}%, recommended: 100%)", "DMARC_POLICY")
     
     # 9. Mail Server - smtp - starttls offered
-    mx = report.get("mx", {})
-    mx_hosts = mx.get("hosts", [])
-    starttls_count = sum(1 for host in mx_hosts if host.get("starttls", False))
-    if starttls_count > 0 and starttls_count == len(mx_hosts):
-        out.append(status("OK", f"✅ CRITERION 9/10: STARTTLS supported on all MX servers ({starttls_count}/{len(mx_hosts)})", "MTA_STS"))
+    starttls_count, mx_host_count = derived.starttls_count, derived.mx_host_count
+    if starttls_count > 0 and starttls_count == mx_host_count:
+        yield Status("OK", f"✅ CRITERION 9/10: STARTTLS supported on all MX servers ({starttls_count}/{mx_host_count})", "MX")
     elif starttls_count > 0:
-        out.append(status("WARNING", f"⚠️ CRITERION 9/10: Partial STARTTLS ({starttls_count}/{len(mx_hosts)} servers)", "MTA_STS"))
+        yield Status("WARNING", f"⚠️ CRITERION 9/10: Partial STARTTLS ({starttls_count}/{mx_host_count} servers)", "MX")
     else:
-        out.append(status("CRITICAL", "❌ CRITERION 9/10: No MX server supports STARTTLS", "MTA_STS"))
+        yield Status("CRITICAL", "❌ CRITERION 9/10: No MX server supports STARTTLS", "MX")
     
     # 10. Mail Server - no pop service (this criterion requires external analysis)
     # Note: This information is not available in standard checkdmarc scan
-    out.append(status("INFO", "ℹ️ CRITERION 10/10: POP service (requires manual verification)", "MTA_STS"))
+    yield _CRIT_POP
     
-    return out
 
 # ----------------- Complete audit with explanations -----------------
 
-def audit_domain(report: dict) -> List[Status]:
+def _dmarc_policy(report: Dict[str, Any]) -> str:
+    return (report.get("dmarc", _EMPTY).get("tags", _EMPTY)
+            .get("p", _EMPTY).get("value", "none"))
+
+_BAR: Final[str] = "=" * 60
+
+# The audit pipeline as data: one (section banner, extractor) pair per
+# protocol. A generated-and-exec'd per-schema analyzer was considered here,
+# but absent sections still produce findings (a missing SPF record IS the
+# critical result), so there are no dead branches to eliminate — a static
+# dispatch table gives the single-indirection call path without the
+# compile step.
+_AUDIT_STAGES: Final[Tuple[Tuple[str, Any], ...]] = (
+    (f"{_BAR}\n📧 SPF (Sender Policy Framework)\n{_BAR}",
+     lambda r, d, v: analyze_spf(r.get("spf"))),
+    (f"{_BAR}\n🔑 DKIM (DomainKeys Identified Mail)\n{_BAR}",
+     lambda r, d, v: analyze_dkim(r.get("dkim"))),
+    (f"{_BAR}\n🛡️ DMARC (Domain-based Message Authentication)\n{_BAR}",
+     lambda r, d, v: analyze_dmarc(r.get("dmarc"))),
+    (f"{_BAR}\n📧 MX SERVERS and STARTTLS\n{_BAR}",
+     lambda r, d, v: analyze_mx_starttls(r.get("mx"), d, v)),
+    (f"{_BAR}\n🔐 MTA-STS (Mail Transfer Agent Strict Transport Security)\n{_BAR}",
+     lambda r, d, v: analyze_mta_sts(r.get("mta_sts"))),
+    (f"{_BAR}\n📊 TLS-RPT (Transport Layer Security Reporting)\n{_BAR}",
+     lambda r, d, v: analyze_tlsrpt(r.get("smtp_tls_reporting"))),
+    (f"{_BAR}\n🔒 DNSSEC (Domain Name System Security Extensions)\n{_BAR}",
+     lambda r, d, v: analyze_dnssec(r.get("dnssec", False))),
+    (f"{_BAR}\n🎨 BIMI (Brand Indicators for Message Identification)\n{_BAR}",
+     lambda r, d, v: analyze_bimi(r.get("bimi"), d.dmarc_policy)),
+    (f"{_BAR}\n📋 SECURITY CRITERIA VERIFICATION\n{_BAR}",
+     lambda r, d, v: analyze_security_criteria(r, d)),
+)
+
+def audit_domain(report: Dict[str, Any], verbose: bool = True) -> List[Status]:
     results: List[Status] = []
-    
-    print("🔍 DETAILED ANALYSIS OF EMAIL AUTHENTICATION PROTOCOLS\n")
-    
-    # SPF Analysis
-    print("=" * 60)
-    print("📧 SPF (Sender Policy Framework)")
-    print("=" * 60)
-    results += analyze_spf(report.get("spf"))
-    
-    # DKIM Analysis  
-    print("=" * 60)
-    print("🔑 DKIM (DomainKeys Identified Mail)")
-    print("=" * 60)
-    results += analyze_dkim(report.get("dkim"))
-    
-    # DMARC Analysis
-    print("=" * 60)
-    print("🛡️ DMARC (Domain-based Message Authentication)")
-    print("=" * 60)
-    results += analyze_dmarc(report.get("dmarc"))
-    
-    # MX and STARTTLS Analysis
-    print("=" * 60)
-    print("📧 MX SERVERS and STARTTLS")
-    print("=" * 60)
-    results += analyze_mx_starttls(report.get("mx"))
-    
-    # MTA-STS Analysis
-    print("=" * 60)
-    print("🔐 MTA-STS (Mail Transfer Agent Strict Transport Security)")
-    print("=" * 60)
-    results += analyze_mta_sts(report.get("mta_sts"))
-    
-    # TLS-RPT Analysis
-    print("=" * 60)
-    print("📊 TLS-RPT (Transport Layer Security Reporting)")
-    print("=" * 60)
-    results += analyze_tlsrpt(report.get("smtp_tls_reporting"))
-    
-    # DNSSEC Analysis
-    print("=" * 60)
-    print("🔒 DNSSEC (Domain Name System Security Extensions)")
-    print("=" * 60)
-    results += analyze_dnssec(report.get("dnssec", False))
-    
-    # BIMI Analysis
-    print("=" * 60)
-    print("🎨 BIMI (Brand Indicators for Message Identification)")
-    print("=" * 60)
-    dmarc_policy = report.get("dmarc", {}).get("tags", {}).get("p", {}).get("value", "none")
-    results += analyze_bimi(report.get("bimi"), dmarc_policy)
-    
-    # Specific security criteria
-    print("=" * 60)
-    print("📋 SECURITY CRITERIA VERIFICATION")
-    print("=" * 60)
-    results += analyze_security_criteria(report)
-    
+
+    if verbose:
+        print("🔍 DETAILED ANALYSIS OF EMAIL AUTHENTICATION PROTOCOLS\n")
+
+    derived = _derive(report)
+    for banner, analyze in _AUDIT_STAGES:
+        if verbose:
+            print(banner)
+        results += analyze(report, derived, verbose)
+
     return results
 
 # ----------------- Excel Export Functions -----------------
 
+def _audit_one(json_file: str) -> Tuple[str, Optional[List[Status]], Optional[str]]:
+    """
+    Excel-mode worker: audits one scan non-verbosely (no banner prints,
+    so workers can't interleave on stdout). Returns (file, statuses,
+    error); a missing file comes back as (file, None, None).
+    """
+    try:
+        statuses = audit_domain(_loads(Path(json_file).read_bytes()), verbose=False)
+        return (json_file, statuses, None)
+    except FileNotFoundError:
+        # Skipped silently, like the old pre-read exists() check — but
+        # without spending a stat on every file that does exist.
+        return (json_file, None, None)
+    except Exception as e:
+        return (json_file, None, str(e))
+
 def generate_excel_report(json_files: List[str], output_dir: Path) -> None:
     """
     Generates a complete Excel report with charts and detailed analysis.
     """
-    if not EXCEL_AVAILABLE:
-        print("❌ Excel libraries are not installed.")
-        print("🔧 To install: pip install pandas openpyxl")
-        return
-    
+    if not _load_openpyxl():
+        print("⚠️ Excel libraries are not installed - falling back to a plain findings workbook.")
+        print("🔧 For the styled report with charts: pip install openpyxl")
+
     print("📊 Generating Excel report...")
     
     # Prepare data
@@ -992,403 +1265,459 @@ def generate_excel_report(json_files: List[str], output_dir: Path) -> None:
         'BIMI': {'OK': 0, 'WARNING': 0, 'CRITICAL': 0}
     }
     
-    # Process each JSON file
-    for json_file in json_files:
-        path = Path(json_file)
-        if not path.exists():
-            continue
-            
-        try:
-            data = json.loads(path.read_text())
-            domain_name = path.stem
-            
-            # Analyze domain
-            statuses = audit_domain(data)
-            
-            # Count issues by category
-            spf_status = get_component_status(statuses, 'SPF')
-            dkim_status = get_component_status(statuses, 'DKIM')
-            dmarc_status = get_component_status(statuses, 'DMARC')
-            mta_sts_status = get_component_status(statuses, 'MTA-STS')
-            tls_rpt_status = get_component_status(statuses, 'TLS-RPT')
-            dnssec_status = get_component_status(statuses, 'DNSSEC')
-            bimi_status = get_component_status(statuses, 'BIMI')
-            
-            # Update global statistics
-            security_overview['SPF'][spf_status] += 1
-            security_overview['DKIM'][dkim_status] += 1
-            security_overview['DMARC'][dmarc_status] += 1
-            security_overview['MTA-STS'][mta_sts_status] += 1
-            security_overview['TLS-RPT'][tls_rpt_status] += 1
-            security_overview['DNSSEC'][dnssec_status] += 1
-            security_overview['BIMI'][bimi_status] += 1
-            
+    # Audit the scans in parallel (pure-Python dict/string work, so
+    # processes, not threads) and merge per-domain results in order.
+    max_workers = min(_usable_cpus(), len(json_files)) or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(_audit_one, json_files,
+                               chunksize=max(1, len(json_files) // (max_workers * 4)))
+        for json_file, statuses, error in results:
+            if statuses is None:
+                if error is not None:
+                    print(f"⚠️ Error processing {json_file}: {error}")
+                continue
+            domain_name = Path(json_file).stem
+
+            # Tally severities and classify components, one pass each,
+            # then thread the counts to every consumer below.
+            severities = Counter(s[0] for s in statuses)
+            comp_status = component_statuses(statuses)
+            for component, level in comp_status.items():
+                security_overview[component][level] += 1
+
             # Calculate global security score
-            security_score = calculate_security_score(statuses)
-            
+            security_score = calculate_security_score(severities, len(statuses))
+
             # Data for main table
             domain_info = {
                 'Domain': domain_name,
                 'Security Score': f"{security_score}%",
-                'SPF': spf_status,
-                'DKIM': dkim_status, 
-                'DMARC': dmarc_status,
-                'MTA-STS': mta_sts_status,
-                'TLS-RPT': tls_rpt_status,
-                'DNSSEC': dnssec_status,
-                'BIMI': bimi_status,
-                'Critical': sum(1 for s in statuses if s[0] == 'CRITICAL'),
-                'Warnings': sum(1 for s in statuses if s[0] == 'WARNING'),
-                'Global Status': get_overall_status(statuses)
+                **comp_status,
+                'Critical': severities['CRITICAL'],
+                'Warnings': severities['WARNING'],
+                'Global Status': get_overall_status(severities)
             }
             domains_data.append(domain_info)
-            
+
             # Issue details
             for status in statuses:
                 if status[0] in ['CRITICAL', 'WARNING']:
                     issue_detail = {
                         'Domain': domain_name,
-                        'Component': extract_component_from_message(status[1]),
+                        'Component': _REF_COMPONENT.get(status[2], 'GENERAL'),
                         'Severity': status[0],
                         'Description': clean_message_for_excel(status[1]),
                         'Reference': status[2]
                     }
                     detailed_issues.append(issue_detail)
-                    
-        except Exception as e:
-            print(f"⚠️ Error processing {json_file}: {e}")
-            continue
-    
+
     # Create Excel file
     excel_file = output_dir / 'checkdmarc_security_report.xlsx'
-    
-    with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
-        # Sheet 1: Overview
-        df_overview = pd.DataFrame(domains_data)
-        df_overview.to_excel(writer, sheet_name='Overview', index=False)
-        
-        # Sheet 2: Detailed issues
-        df_issues = pd.DataFrame(detailed_issues)
-        df_issues.to_excel(writer, sheet_name='Detailed Issues', index=False)
-        
-        # Sheet 3: Component statistics
-        stats_data = []
-        for component, stats in security_overview.items():
-            total = sum(stats.values())
-            if total > 0:
-                stats_data.append({
-                    'Component': component,
-                    'Total Domains': total,
-                    'OK': stats['OK'],
-                    'Warnings': stats['WARNING'],
-                    'Critical': stats['CRITICAL'],
-                    '% OK': round((stats['OK'] / total) * 100, 1),
-                    '% Issues': round(((stats['WARNING'] + stats['CRITICAL']) / total) * 100, 1)
-                })
-        
-        df_stats = pd.DataFrame(stats_data)
-        df_stats.to_excel(writer, sheet_name='Statistics', index=False)
-    
-    # Enhance formatting and add charts
-    enhance_excel_formatting(excel_file, security_overview, domains_data)
-    
-    print(f"✅ Excel report generated successfully: {excel_file}")
-    print("📊 The report contains:")
-    print("   • Overview with security scores")
-    print("   • Detailed issue analysis")
-    print("   • Component statistics")
-    print("   • Interactive charts")
-
-def get_component_status(statuses: List[Status], component: str) -> str:
-    """Determines component status based on analysis messages."""
-    critical_found = False
-    warning_found = False
-    
-    for status in statuses:
-        message = status[1].upper()
-        if component.upper() in message:
-            if status[0] == 'CRITICAL':
-                critical_found = True
-            elif status[0] == 'WARNING':
-                warning_found = True
-    
-    if critical_found:
-        return 'CRITICAL'
-    elif warning_found:
-        return 'WARNING'
+
+    # Sheet 3 data: component statistics
+    stats_data = []
+    for component, stats in security_overview.items():
+        total = sum(stats.values())
+        if total > 0:
+            stats_data.append({
+                'Component': component,
+                'Total Domains': total,
+                'OK': stats['OK'],
+                'Warnings': stats['WARNING'],
+                'Critical': stats['CRITICAL'],
+                '% OK': round((stats['OK'] / total) * 100, 1),
+                '% Issues': round(((stats['WARNING'] + stats['CRITICAL']) / total) * 100, 1)
+            })
+
+    if OPENPYXL_AVAILABLE:
+        _write_styled_report(excel_file, domains_data, detailed_issues,
+                             stats_data, security_overview)
+        print(f"✅ Excel report generated successfully: {excel_file}")
+        print("📊 The report contains:")
+        print("   • Overview with security scores")
+        print("   • Detailed issue analysis")
+        print("   • Component statistics")
+        print("   • Interactive charts")
     else:
-        return 'OK'
+        rows = [list(_ISSUE_COLUMNS)]
+        rows.extend([issue[name] for name in _ISSUE_COLUMNS]
+                    for issue in detailed_issues)
+        _write_xlsx_raw(excel_file, rows)
+        print(f"✅ Findings workbook generated (no styling): {excel_file}")
+
+# Each Status already carries a stable reference code in its third field,
+# so component classification is a dict lookup on it instead of substring
+# scans over every (uppercased) message.
+_REF_COMPONENT: Final[Dict[str, str]] = {
+    'SPF_LIMIT': 'SPF', 'SPF_ALL': 'SPF',
+    'DKIM_LEN': 'DKIM',
+    'DMARC_POLICY': 'DMARC',
+    'MTA_STS': 'MTA-STS',
+    'TLS_RPT': 'TLS-RPT',
+    'DNSSEC': 'DNSSEC',
+    'BIMI': 'BIMI',
+    'MX': 'MX',
+}
+_SEVERITY_RANK: Final[Dict[str, int]] = {'OK': 0, 'INFO': 0, 'WARNING': 1, 'CRITICAL': 2}
+_RANK_LEVEL: Final[Tuple[str, ...]] = ('OK', 'WARNING', 'CRITICAL')
+_OVERVIEW_COMPONENTS: Final[Tuple[str, ...]] = (
+    'SPF', 'DKIM', 'DMARC', 'MTA-STS', 'TLS-RPT', 'DNSSEC', 'BIMI')
 
-def calculate_security_score(statuses: List[Status]) -> int:
-    """Calculates a global security score based on statuses."""
-    total_checks = len(statuses)
+def component_statuses(statuses: List[Status]) -> Dict[str, str]:
+    """Worst severity per overview component in a single pass."""
+    worst = dict.fromkeys(_OVERVIEW_COMPONENTS, 0)
+    for status in statuses:
+        component = _REF_COMPONENT.get(status[2])
+        if component in worst:
+            rank = _SEVERITY_RANK.get(status[0], 0)
+            if rank > worst[component]:
+                worst[component] = rank
+    return {component: _RANK_LEVEL[rank] for component, rank in worst.items()}
+
+def calculate_security_score(severities: Counter, total_checks: int) -> int:
+    """Calculates a global security score from the severity tallies."""
     if total_checks == 0:
         return 0
-    
-    critical_count = sum(1 for s in statuses if s[0] == 'CRITICAL')
-    warning_count = sum(1 for s in statuses if s[0] == 'WARNING')
-    ok_count = sum(1 for s in statuses if s[0] == 'OK')
-    
+
     # Weighted score: OK=100%, WARNING=50%, CRITICAL=0%
-    score = (ok_count * 100 + warning_count * 50 + critical_count * 0) / total_checks
+    score = (severities['OK'] * 100 + severities['WARNING'] * 50) / total_checks
     return round(score)
 
-def get_overall_status(statuses: List[Status]) -> str:
+def get_overall_status(severities: Counter) -> str:
     """Determines the global domain status."""
-    critical_count = sum(1 for s in statuses if s[0] == 'CRITICAL')
-    warning_count = sum(1 for s in statuses if s[0] == 'WARNING')
-    
-    if critical_count > 0:
+    if severities['CRITICAL'] > 0:
         return '🚨 CRITICAL'
-    elif warning_count > 0:
+    elif severities['WARNING'] > 0:
         return '⚠️ WARNING'
     else:
         return '✅ EXCELLENT'
 
-def extract_component_from_message(message: str) -> str:
-    """Extracts the main component from error message."""
-    message_upper = message.upper()
-    components = ['SPF', 'DKIM', 'DMARC', 'MTA-STS', 'TLS-RPT', 'DNSSEC', 'BIMI']
-    
-    for comp in components:
-        if comp in message_upper:
-            return comp
-    return 'GENERAL'
+# Compiled once: the ANSI stripper and a single alternation over the
+# emoji table, so cleaning is two regex passes instead of one sub plus
+# twelve full-string replace scans per message.
+_ANSI_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+_EMOJI_REPLACEMENTS: Final[Dict[str, str]] = {
+    '🔥': '[DANGER]',
+    '💥': '[IMPACT]',
+    '🛠️': '[SOLUTION]',
+    '⚡': '[RISKS]',
+    '🔧': '[CORRECTION]',
+    '✅': '[OK]',
+    '🎯': '[RESULT]',
+    '🛡️': '[PROTECTION]',
+    '🚨': '[CRITICAL]',
+    '⚠️': '[WARNING]',
+    '🔴': '[ERROR]',
+    '💀': '[CRITICAL IMPACT]'
+}
+_EMOJI_RE = re.compile('|'.join(re.escape(e) for e in _EMOJI_REPLACEMENTS))
 
 def clean_message_for_excel(message: str) -> str:
     """Clean message for Excel display."""
-    # Remove color codes and emojis for Excel
-    import re
-    # Remove ANSI codes
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    cleaned = ansi_escape.sub('', message)
-    
-    # Replace emojis with words
-    emoji_replacements = {
-        '🔥': '[DANGER]',
-        '💥': '[IMPACT]',
-        '🛠️': '[SOLUTION]',
-        '⚡': '[RISKS]',
-        '🔧': '[CORRECTION]',
-        '✅': '[OK]',
-        '🎯': '[RESULT]',
-        '🛡️': '[PROTECTION]',
-        '🚨': '[CRITICAL]',
-        '⚠️': '[WARNING]',
-        '🔴': '[ERROR]',
-        '💀': '[CRITICAL IMPACT]'
-    }
-    
-    for emoji, replacement in emoji_replacements.items():
-        cleaned = cleaned.replace(emoji, replacement)
-    
+    # Remove ANSI codes, then replace emojis with words
+    cleaned = _ANSI_RE.sub('', message)
+    cleaned = _EMOJI_RE.sub(lambda m: _EMOJI_REPLACEMENTS[m.group(0)], cleaned)
+
     # Limit length for Excel
     if len(cleaned) > 300:
         cleaned = cleaned[:297] + '...'
-    
+
     return cleaned.strip()
 
-def enhance_excel_formatting(excel_file: Path, security_overview: Dict, domains_data: List[Dict]) -> None:
-    """Enhance Excel formatting and add charts."""
-    wb = openpyxl.load_workbook(excel_file)
-    
-    # Styles
+# Minimal single-sheet XLSX skeleton: the format is just zipped XML, so a
+# plain findings workbook needs no xlsx library at all. Inline strings
+# (t="inlineStr") sidestep the shared-strings table so rows can be
+# streamed with O(1) memory.
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+_XLSX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Findings" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    '</Relationships>'
+)
+
+def _write_xlsx_raw(path: Path, rows: List[list]) -> None:
+    """Write a bare single-sheet workbook with no xlsx dependency.
+
+    Fallback used when openpyxl is missing: the fixed parts come from the
+    string constants above and the sheet XML is streamed row by row.
+    """
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('[Content_Types].xml', _XLSX_CONTENT_TYPES)
+        zf.writestr('_rels/.rels', _XLSX_RELS)
+        zf.writestr('xl/workbook.xml', _XLSX_WORKBOOK)
+        zf.writestr('xl/_rels/workbook.xml.rels', _XLSX_WORKBOOK_RELS)
+        with zf.open('xl/worksheets/sheet1.xml', 'w') as sheet:
+            sheet.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                b'<sheetData>'
+            )
+            for i, row in enumerate(rows, start=1):
+                cells = []
+                for value in row:
+                    if isinstance(value, (int, float)) and not isinstance(value, bool):
+                        cells.append(f'<c t="n"><v>{value}</v></c>')
+                    else:
+                        cells.append(f'<c t="inlineStr"><is><t>{escape(str(value))}</t></is></c>')
+                sheet.write(f'<row r="{i}">{"".join(cells)}</row>'.encode('utf-8'))
+            sheet.write(b'</sheetData></worksheet>')
+
+# Sheet headers (column order matters: fills and alignments below are
+# keyed on these positions).
+_OVERVIEW_COLUMNS = ('Domain', 'Security Score', 'SPF', 'DKIM', 'DMARC',
+                     'MTA-STS', 'TLS-RPT', 'DNSSEC', 'BIMI',
+                     'Critical', 'Warnings', 'Global Status')
+_ISSUE_COLUMNS = ('Domain', 'Component', 'Severity', 'Description', 'Reference')
+_STATS_COLUMNS = ('Component', 'Total Domains', 'OK', 'Warnings', 'Critical',
+                  '% OK', '% Issues')
+
+def _write_styled_report(excel_file: Path, domains_data: List[Dict],
+                         detailed_issues: List[Dict],
+                         stats_data: List[Dict],
+                         security_overview: Dict) -> None:
+    """Write the styled workbook in openpyxl write-only mode.
+
+    Rows are streamed straight to disk instead of being materialized as a
+    full cell grid and restyled afterwards, which keeps memory flat on
+    large batches. Styles must therefore be attached at append time
+    (WriteOnlyCell) and dimensions set before the first row of a sheet.
+    """
     header_font = Font(bold=True, color="FFFFFF")
     header_fill = PatternFill(start_color="2F4F4F", end_color="2F4F4F", fill_type="solid")
-    
+
     critical_fill = PatternFill(start_color="FFE6E6", end_color="FFE6E6", fill_type="solid")
     warning_fill = PatternFill(start_color="FFF4E6", end_color="FFF4E6", fill_type="solid")
     ok_fill = PatternFill(start_color="E6F7E6", end_color="E6F7E6", fill_type="solid")
-    
+
     border = Border(
         left=Side(style='thin'),
-        right=Side(style='thin'), 
+        right=Side(style='thin'),
         top=Side(style='thin'),
         bottom=Side(style='thin')
     )
-    
-    # Format the Overview sheet
-    if 'Overview' in wb.sheetnames:
-        ws_overview = wb['Overview']
-        
-        # Headers
-        for cell in ws_overview[1]:
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-            cell.border = border
-        
-        # Data with conditional colors
-        for row in ws_overview.iter_rows(min_row=2, max_row=ws_overview.max_row):
-            for cell in row:
-                cell.border = border
-                cell.alignment = Alignment(horizontal='center', vertical='center')
-                
-                # Coloring based on status
-                if cell.value in ['CRITICAL', '🚨 CRITICAL']:
-                    cell.fill = critical_fill
-                elif cell.value in ['WARNING', '⚠️ WARNING']:
-                    cell.fill = warning_fill
-                elif cell.value in ['OK', '✅ EXCELLENT']:
-                    cell.fill = ok_fill
-        
-        # Adjust column widths
-        for column in ws_overview.columns:
-            max_length = max(len(str(cell.value or '')) for cell in column)
-            ws_overview.column_dimensions[column[0].column_letter].width = min(max_length + 2, 30)
-        
-        # Add a pie chart for global status
-        if len(domains_data) > 0:
-            add_pie_chart_overview(ws_overview, domains_data)
-    
-    # Format the Statistics sheet
-    if 'Statistics' in wb.sheetnames:
-        ws_stats = wb['Statistics']
-        
-        # Headers
-        for cell in ws_stats[1]:
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-            cell.border = border
-        
-        # Data
-        for row in ws_stats.iter_rows(min_row=2, max_row=ws_stats.max_row):
-            for cell in row:
-                cell.border = border
-                cell.alignment = Alignment(horizontal='center', vertical='center')
-        
-        # Adjust widths
-        for column in ws_stats.columns:
-            max_length = max(len(str(cell.value or '')) for cell in column)
-            ws_stats.column_dimensions[column[0].column_letter].width = min(max_length + 2, 20)
-        
-        # Add a bar chart
-        add_bar_chart_stats(ws_stats, security_overview)
-    
-    # Format the Detailed Issues sheet
-    if 'Detailed Issues' in wb.sheetnames:
-        ws_issues = wb['Detailed Issues']
-        
-        # Headers
-        for cell in ws_issues[1]:
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-            cell.border = border
-        
-        # Data with conditional colors
-        for row in ws_issues.iter_rows(min_row=2, max_row=ws_issues.max_row):
-            severity_cell = row[2]  # Severity column
-            for cell in row:
-                cell.border = border
-                if cell.column_letter in ['A', 'B', 'C', 'E']:  # Specific columns
-                    cell.alignment = Alignment(horizontal='center', vertical='center')
-                else:
-                    cell.alignment = Alignment(horizontal='left', vertical='top', wrap_text=True)
-                
-                # Coloring based on severity
-                if severity_cell.value == 'CRITICAL':
-                    cell.fill = critical_fill
-                elif severity_cell.value == 'WARNING':
-                    cell.fill = warning_fill
-        
-        # Adjust widths
-        ws_issues.column_dimensions['A'].width = 20  # Domain
-        ws_issues.column_dimensions['B'].width = 15  # Component
-        ws_issues.column_dimensions['C'].width = 12  # Severity
-        ws_issues.column_dimensions['D'].width = 50  # Description
-        ws_issues.column_dimensions['E'].width = 25  # Reference
-        
-        # Row height for text wrap
-        for row_num in range(2, ws_issues.max_row + 1):
-            ws_issues.row_dimensions[row_num].height = 60
-    
+    center = Alignment(horizontal='center', vertical='center')
+    wrapped = Alignment(horizontal='left', vertical='top', wrap_text=True)
+
+    # Coloring based on status / severity
+    status_fills = {
+        'CRITICAL': critical_fill, '🚨 CRITICAL': critical_fill,
+        'WARNING': warning_fill, '⚠️ WARNING': warning_fill,
+        'OK': ok_fill, '✅ EXCELLENT': ok_fill,
+    }
+
+    wb = openpyxl.Workbook(write_only=True)
+
+    def styled(ws, value, fill=None, alignment=center, font=None):
+        cell = WriteOnlyCell(ws, value=value)
+        cell.border = border
+        cell.alignment = alignment
+        if fill is not None:
+            cell.fill = fill
+        if font is not None:
+            cell.font = font
+        return cell
+
+    def header_row(ws, columns):
+        return [styled(ws, name, fill=header_fill, font=header_font)
+                for name in columns]
+
+    def set_widths(ws, columns, rows, cap):
+        for idx, name in enumerate(columns):
+            max_length = max([len(name)] + [len(str(r[name])) for r in rows])
+            letter = chr(ord('A') + idx)
+            ws.column_dimensions[letter].width = min(max_length + 2, cap)
+
+    # Sheet 1: Overview
+    ws = wb.create_sheet('Overview')
+    set_widths(ws, _OVERVIEW_COLUMNS, domains_data, 30)
+    ws.append(header_row(ws, _OVERVIEW_COLUMNS))
+    for info in domains_data:
+        ws.append([styled(ws, info[name], fill=status_fills.get(info[name]))
+                   for name in _OVERVIEW_COLUMNS])
+    if domains_data:
+        _append_pie_chart(ws, domains_data)
+
+    # Sheet 2: Detailed issues
+    ws = wb.create_sheet('Detailed Issues')
+    for letter, width in (('A', 20), ('B', 15), ('C', 12), ('D', 50), ('E', 25)):
+        ws.column_dimensions[letter].width = width
+    # Row height for text wrap
+    for row_num in range(2, len(detailed_issues) + 2):
+        ws.row_dimensions[row_num].height = 60
+    ws.append(header_row(ws, _ISSUE_COLUMNS))
+    for issue in detailed_issues:
+        fill = status_fills.get(issue['Severity'])
+        ws.append([styled(ws, issue[name], fill=fill,
+                          alignment=wrapped if name == 'Description' else center)
+                   for name in _ISSUE_COLUMNS])
+
+    # Sheet 3: Component statistics
+    ws = wb.create_sheet('Statistics')
+    set_widths(ws, _STATS_COLUMNS, stats_data, 20)
+    ws.append(header_row(ws, _STATS_COLUMNS))
+    for entry in stats_data:
+        ws.append([styled(ws, entry[name]) for name in _STATS_COLUMNS])
+    _append_bar_chart(ws, len(stats_data), security_overview)
+
     wb.save(excel_file)
 
-def add_pie_chart_overview(worksheet, domains_data: List[Dict]) -> None:
-    """Add a pie chart for global status."""
+def _append_pie_chart(worksheet, domains_data: List[Dict]) -> None:
+    """Append a pie chart for global status."""
     # Count statuses
-    status_counts = {}
+    status_counts: Dict[str, int] = {}
     for domain in domains_data:
         status = domain['Global Status']
         status_counts[status] = status_counts.get(status, 0) + 1
-    
+
     if not status_counts:
         return
-    
-    # Create data for the chart
+
+    # Pad down to a free block below the table (header + data rows are
+    # already appended), then stream the chart's source cells.
     start_row = len(domains_data) + 5
-    worksheet[f'A{start_row}'] = 'Status'
-    worksheet[f'B{start_row}'] = 'Count'
-    
+    for _ in range(start_row - len(domains_data) - 2):
+        worksheet.append([])
+    worksheet.append(['Status', 'Count'])
+
     row = start_row + 1
     for status, count in status_counts.items():
-        worksheet[f'A{row}'] = status
-        worksheet[f'B{row}'] = count
-        row += 1    
+        worksheet.append([status, count])
+        row += 1
     # Create the chart
     chart = PieChart()
     chart.title = "Security Status Distribution"
-    
+
     data = Reference(worksheet, min_col=2, min_row=start_row, max_row=row-1)
     labels = Reference(worksheet, min_col=1, min_row=start_row+1, max_row=row-1)
-    
+
     chart.add_data(data, titles_from_data=False)
     chart.set_categories(labels)
-    
+
     # Positioning
-    chart.anchor = f'F{start_row}'
     chart.width = 15
     chart.height = 10
-    
-    worksheet.add_chart(chart)
 
-def add_bar_chart_stats(worksheet, security_overview: Dict) -> None:
-    """Add a bar chart for component statistics."""
+    worksheet.add_chart(chart, f'F{start_row}')
+
+def _append_bar_chart(worksheet, data_rows: int, security_overview: Dict) -> None:
+    """Append a bar chart for component statistics."""
     if not security_overview:
         return
-    
-    # Find a free position
-    start_row = worksheet.max_row + 3
-    
-    # Create data for the chart
-    worksheet[f'A{start_row}'] = 'Component'
-    worksheet[f'B{start_row}'] = 'OK'
-    worksheet[f'C{start_row}'] = 'Warnings'
-    worksheet[f'D{start_row}'] = 'Critical'
-    
+
+    # Find a free position (header + data rows are already appended)
+    start_row = data_rows + 4
+    for _ in range(start_row - data_rows - 2):
+        worksheet.append([])
+    worksheet.append(['Component', 'OK', 'Warnings', 'Critical'])
+
     row = start_row + 1
     for component, stats in security_overview.items():
         total = sum(stats.values())
         if total > 0:
-            worksheet[f'A{row}'] = component
-            worksheet[f'B{row}'] = stats['OK']
-            worksheet[f'C{row}'] = stats['WARNING']
-            worksheet[f'D{row}'] = stats['CRITICAL']
+            worksheet.append([component, stats['OK'], stats['WARNING'],
+                              stats['CRITICAL']])
             row += 1
-    
+
     # Create the chart
     chart = BarChart()
     chart.title = "Security Status by Component"
     chart.x_axis.title = "Components"
     chart.y_axis.title = "Number of domains"
-    
+
     data = Reference(worksheet, min_col=2, min_row=start_row, max_col=4, max_row=row-1)
     categories = Reference(worksheet, min_col=1, min_row=start_row+1, max_row=row-1)
-    
+
     chart.add_data(data, titles_from_data=True)
     chart.set_categories(categories)
-    
+
     # Style
     chart.type = "col"
-    chart.style = 10    
+    chart.style = 10
     # Positioning
-    chart.anchor = f'F{start_row}'
     chart.width = 20
     chart.height = 12
-    
-    worksheet.add_chart(chart)
+
+    worksheet.add_chart(chart, f'F{start_row}')
+
+# ----------------- Multi-file worker -----------------
+
+# Per-worker-process memo of fully analyzed scans keyed on a content
+# digest (a Manager-backed shared dict would serialize every hit across
+# processes and cost more than the re-audit it saves).
+_AUDIT_CACHE: Dict[bytes, Tuple[str, List[Status]]] = {}
+
+def analyze_file(file: str) -> Tuple[str, str, Optional[List[Status]], Optional[str]]:
+    """
+    Audits a single scan file and returns (file, banner_output, statuses, error).
+
+    Safe to run in a worker process: the section banners printed by
+    audit_domain are captured into a buffer instead of the shared stdout,
+    so parallel workers never interleave their output.
+    """
+    path = Path(file)
+    if not path.exists():
+        return (file, "", None, "not_found")
+
+    buf = io.StringIO()
+    try:
+        raw = path.read_bytes()
+
+        # Duplicate inputs (shell globs listing the same scan twice, CI
+        # re-runs) are common in batch mode and the audit is a pure
+        # function of the bytes, so re-audits are served from a digest-
+        # keyed memo. blake2b at 16 bytes costs far less than one parse.
+        key = hashlib.blake2b(raw, digest_size=16).digest()
+        cached = _AUDIT_CACHE.get(key)
+        if cached is not None:
+            return (file, cached[0], cached[1], None)
+
+        data = _loads(raw)
+        with contextlib.redirect_stdout(buf):
+            statuses = audit_domain(data)
+        banners = buf.getvalue()
+        _AUDIT_CACHE[key] = (banners, statuses)
+        return (file, banners, statuses, None)
+    except Exception as e:
+        return (file, buf.getvalue(), None, str(e))
+
+def _usable_cpus() -> int:
+    """CPUs this process may actually run on. os.cpu_count() reports host
+    cores, which over-subscribes the pool inside cgroup/cpuset-limited
+    containers; the scheduler affinity mask reflects the real quota."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def _dump_json(payload: list) -> None:
+    """Serializes the report with orjson (Rust encoder, writes bytes
+    directly) and falls back to stdlib json when orjson is absent."""
+    if orjson is not None:
+        sys.stdout.buffer.write(
+            orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    else:
+        sys.stdout.write(json.dumps(payload, indent=2, ensure_ascii=False) + "\n")
 
 # ----------------- Main avec rapport final -----------------
 
@@ -1409,84 +1738,148 @@ Usage examples:
         """
     )
     
-    parser.add_argument('json_files', nargs='+', 
-                       help='JSON files generated by checkdmarc to analyze')
+    parser.add_argument('json_files', nargs='+',
+                       help='JSON files generated by checkdmarc to analyze '
+                            '(a directory stands for its *.json files)')
     parser.add_argument('-excel', '--excel', action='store_true',
                        help='Generate a complete Excel report with charts')
+    parser.add_argument('-json', '--json', action='store_true',
+                       help='Emit a machine-readable JSON report (for CI/CD tooling)')
     
     args = parser.parse_args()
-    
+
     if not args.json_files:
         parser.print_help()
         sys.exit(1)
-    
-    # Automatically detect output directory
-    output_dir = None
-    if args.excel:
-        # Use the directory of the first JSON file as base
-        first_file = Path(args.json_files[0])
-        if first_file.exists():
-            output_dir = first_file.parent
+
+    # A directory argument stands for its *.json scans: one scandir pass
+    # (DirEntry.is_file is cached from readdir, so no per-file stat) in
+    # name order, so whole scan dumps don't need a shell glob.
+    expanded: List[str] = []
+    for arg in args.json_files:
+        if os.path.isdir(arg):
+            with os.scandir(arg) as entries:
+                expanded.extend(
+                    entry.path
+                    for entry in sorted(entries, key=lambda e: e.name)
+                    if entry.is_file() and entry.name.endswith('.json'))
         else:
-            output_dir = Path.cwd()
-        
-        print(f"📂 Excel output directory: {output_dir}")
+            expanded.append(arg)
+
+    # Shell globs and CI invocations routinely repeat paths; analyzing the
+    # same file twice only duplicates output. dict.fromkeys dedupes while
+    # keeping the order the user gave.
+    args.json_files = list(dict.fromkeys(expanded))
 
-    overall_ok = True
-    total_domains = 0
-    critical_issues = 0
-    warning_issues = 0
+    if not args.json_files:
+        print("❌ No JSON files found to analyze")
+        sys.exit(1)
     
     # If Excel mode only, silent processing
     if args.excel:
+        # Use the directory of the first JSON file as output base
+        first_file = Path(args.json_files[0])
+        output_dir = first_file.parent if first_file.exists() else Path.cwd()
+        print(f"📂 Excel output directory: {output_dir}")
         print("📊 Excel generation mode activated - Silent analysis processing...")
-        
+
         # Generate Excel report
         generate_excel_report(args.json_files, output_dir)
         return
+
+    overall_ok: bool = True
+    total_domains: int = 0
+    critical_issues: int = 0
+    warning_issues: int = 0
     
     # Normal mode with detailed display
-    for file in args.json_files:
-        path = Path(file)
-        if not path.exists():
+    # Each file is independent, so multi-file runs fan out to a process
+    # pool; all printing stays here on the main process (ordered output).
+    if len(args.json_files) > 1:
+        # No point spawning more workers than there are files to analyze.
+        max_workers = min(_usable_cpus(), len(args.json_files))
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        # Scale the map chunk with the batch instead of a fixed constant:
+        # one pickle round-trip per ~quarter of a worker's share keeps
+        # submission overhead flat on thousand-file batches while still
+        # load-balancing uneven files.
+        chunksize = max(1, len(args.json_files) // (max_workers * 4))
+        results = executor.map(analyze_file, args.json_files, chunksize=chunksize)
+    else:
+        executor = None
+        results = map(analyze_file, args.json_files)
+
+    if args.json:
+        payload = []
+        for file, banners, statuses, error in results:
+            entry: dict = {"file": file, "domain": Path(file).stem}
+            if error == "not_found":
+                entry["error"] = "file not found"
+            elif error is not None:
+                entry["error"] = error
+                overall_ok = False
+            else:
+                sts = statuses or []
+                entry["statuses"] = [{"level": lvl, "msg": msg, "ref": REF.get(ref, ref)}
+                                     for lvl, msg, ref in sts]
+                entry["critical"] = sum(1 for s in sts if s.level == "CRITICAL")
+                entry["warnings"] = sum(1 for s in sts if s.level == "WARNING")
+                if entry["critical"]:
+                    overall_ok = False
+            payload.append(entry)
+        if executor is not None:
+            executor.shutdown()
+        _dump_json(payload)
+        sys.exit(0 if overall_ok else 1)
+
+    for file, banners, statuses, error in results:
+        if error == "not_found":
             print(f"❌ File not found: {file}")
             continue
 
         total_domains += 1
-        print(f"\n🎯 ===== EMAIL SECURITY AUDIT FOR: {path.stem.upper()} =====")
-        
-        try:
-            data = json.loads(path.read_text())
-            statuses = audit_domain(data)
-            
-            domain_critical = 0
-            domain_warnings = 0
-            
-            for st in statuses:
-                print_status(st)
-                if st[0] == "CRITICAL":
-                    overall_ok = False
-                    domain_critical += 1
-                    critical_issues += 1
-                elif st[0] == "WARNING":
-                    domain_warnings += 1
-                    warning_issues += 1
-            
-            # Domain summary
-            print("=" * 60)
-            print(f"📊 SUMMARY FOR {path.stem.upper()}")
-            print("=" * 60)
-            if domain_critical == 0 and domain_warnings == 0:
-                print("🏆 EXCELLENT! Exemplary email configuration!")
-            elif domain_critical == 0:
-                print(f"✅ GOOD! {domain_warnings} recommended improvements")
-            else:
-                print(f"🚨 CRITICAL! {domain_critical} major issues + {domain_warnings} warnings")
-            print()
-            
-        except Exception as e:
-            print(f"❌ Error analyzing {file}: {e}")
+
+        # The whole per-domain report is assembled in a buffer and flushed
+        # with a single write: with dozens of statuses per file, per-line
+        # print() calls spend more time in stdout locking/flushing than in
+        # formatting, and one atomic write keeps multi-process runs tidy.
+        buf = io.StringIO()
+        buf.write(f"\n🎯 ===== EMAIL SECURITY AUDIT FOR: {Path(file).stem.upper()} =====\n")
+        buf.write(banners)
+
+        if error is not None:
+            buf.write(f"❌ Error analyzing {file}: {error}\n")
             overall_ok = False
+            sys.stdout.write(buf.getvalue())
+            continue
+
+        domain_critical = 0
+        domain_warnings = 0
+
+        for st in statuses or []:
+            buf.write(format_status(st))
+            if st[0] == "CRITICAL":
+                overall_ok = False
+                domain_critical += 1
+                critical_issues += 1
+            elif st[0] == "WARNING":
+                domain_warnings += 1
+                warning_issues += 1
+
+        # Domain summary
+        buf.write(f"{_BAR}\n📊 SUMMARY FOR {Path(file).stem.upper()}\n{_BAR}\n")
+        if domain_critical == 0 and domain_warnings == 0:
+            buf.write("🏆 EXCELLENT! Exemplary email configuration!\n")
+        elif domain_critical == 0:
+            buf.write(f"✅ GOOD! {domain_warnings} recommended improvements\n")
+        else:
+            buf.write(f"🚨 CRITICAL! {domain_critical} major issues + {domain_warnings} warnings\n")
+        buf.write("\n")
+
+        sys.stdout.write(buf.getvalue())
+
+    if executor is not None:
+        executor.shutdown()
 
     # Global final report
     print("\n" + "=" * 80)
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Build script for checkdmarc_analyzer.
+
+The analyzer module is fully type-annotated, branchy pure-Python dict
+work — exactly what mypyc speeds up, typically 2-5x. The ahead-of-time
+compile is opt-in so a plain install never depends on mypy or a C
+toolchain:
+
+    pip install mypy && CHECKDMARC_MYPYC=1 python setup.py build_ext --inplace
+
+Without the flag (or without mypy installed) this is a pure-Python
+install.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("CHECKDMARC_MYPYC"):
+    from mypyc.build import mypycify
+    ext_modules = mypycify(["checkdmarc_enhanced.py"])
+
+setup(
+    name="checkdmarc-analyzer",
+    version="1.0.0",
+    description="Analyseur de rapports checkdmarc (SPF/DKIM/DMARC/MTA-STS/TLS-RPT/DNSSEC/BIMI)",
+    py_modules=["checkdmarc_enhanced"],
+    ext_modules=ext_modules,
+    python_requires=">=3.8",
+    extras_require={
+        "excel": ["openpyxl"],
+    },
+)